@@ -1,232 +1,494 @@
+import os
+import sys
 import time
+import ctypes
+import functools
+from enum import IntEnum
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pyautogui
-from window_ops import find_window
+from window_ops import find_window, invalidate_window
 import ui_detection
+import capture
+from utils import wait_until
+from verification import verify_action_completion, verify_screen_stable
+
+# pyautogui sleeps PAUSE seconds after every call (and between every key in
+# typewrite/hotkey) - input here is followed by explicit settle checks instead.
+# FAILSAFE stays on so slamming the mouse into a corner still aborts a run.
+pyautogui.PAUSE = 0
+
+
+def wait_for_input_settled(timeout=0.5, stable_frames=2):
+    """Wait until the screen reacts to input and stops changing, instead of a fixed sleep
+    
+    Stability only counts once a change has been seen, so the wait can't end
+    before the app has drawn its response. If nothing changes, this waits the
+    full timeout - the fixed delay it replaces.
+    
+    Args:
+        timeout: Maximum seconds to wait
+        stable_frames: Consecutive unchanged frames required after the change
+        
+    Returns:
+        True if the screen changed and settled, False on timeout
+    """
+    state = {'previous': capture.get_thumbnail(), 'stable': 0, 'changed': False}
+
+    def _settled():
+        current = capture.get_thumbnail()
+        if np.array_equal(current, state['previous']):
+            state['stable'] += 1
+        else:
+            state['changed'] = True
+            state['stable'] = 0
+        state['previous'] = current
+        return state['changed'] and state['stable'] >= stable_frames
+
+    return wait_until(_settled, timeout=timeout, interval=0.02)
+
+
+_INPUT_KEYBOARD = 1
+_KEYEVENTF_KEYUP = 0x0002
+_KEYEVENTF_UNICODE = 0x0004
+_VK_RETURN = 0x0D
+_VK_TAB = 0x09
+_send_input = None
+
+
+def _get_send_input():
+    """Build the ctypes SendInput binding on first use (Windows only)
+
+    Returns:
+        (SendInput function, INPUT structure class), or None off Windows
+    """
+    global _send_input
+    if _send_input is None:
+        try:
+            class KEYBDINPUT(ctypes.Structure):
+                _fields_ = [('wVk', ctypes.c_ushort), ('wScan', ctypes.c_ushort),
+                            ('dwFlags', ctypes.c_ulong), ('time', ctypes.c_ulong),
+                            ('dwExtraInfo', ctypes.c_size_t)]
+
+            class MOUSEINPUT(ctypes.Structure):
+                _fields_ = [('dx', ctypes.c_long), ('dy', ctypes.c_long),
+                            ('mouseData', ctypes.c_ulong), ('dwFlags', ctypes.c_ulong),
+                            ('time', ctypes.c_ulong), ('dwExtraInfo', ctypes.c_size_t)]
+
+            class INPUTUNION(ctypes.Union):
+                # MOUSEINPUT is the largest member, so it fixes the union's size
+                _fields_ = [('ki', KEYBDINPUT), ('mi', MOUSEINPUT)]
+
+            class INPUT(ctypes.Structure):
+                _fields_ = [('type', ctypes.c_ulong), ('union', INPUTUNION)]
+
+            _send_input = (ctypes.windll.user32.SendInput, INPUT)
+        except Exception:
+            _send_input = False
+    return _send_input or None
+
+
+def _type_text_fast(text):
+    """Type text with a single SendInput call, falling back to pyautogui
+
+    Characters are sent as Unicode key events, so text doesn't depend on the
+    keyboard layout; newlines and tabs are sent as real Enter/Tab presses.
+    """
+    binding = _get_send_input()
+    if not binding or not text:
+        pyautogui.typewrite(text, interval=0)
+        return
+
+    send_input, INPUT = binding
+    events = []
+    for char in text:
+        if char in '\r\n':
+            if char == '\r':
+                continue
+            codes = [(_VK_RETURN, 0, 0)]
+        elif char == '\t':
+            codes = [(_VK_TAB, 0, 0)]
+        else:
+            # UTF-16 code units - characters outside the BMP need a surrogate pair
+            data = char.encode('utf-16-le')
+            codes = [(0, int.from_bytes(data[i:i+2], 'little'), _KEYEVENTF_UNICODE)
+                     for i in range(0, len(data), 2)]
+        for vk, scan, flags in codes:
+            events.append((vk, scan, flags))
+            events.append((vk, scan, flags | _KEYEVENTF_KEYUP))
+
+    inputs = (INPUT * len(events))()
+    for item, (vk, scan, flags) in zip(inputs, events):
+        item.type = _INPUT_KEYBOARD
+        item.union.ki.wVk = vk
+        item.union.ki.wScan = scan
+        item.union.ki.dwFlags = flags
+
+    sent = send_input(len(events), inputs, ctypes.sizeof(INPUT))
+    if sent != len(events):
+        print(f"[WARN] SendInput delivered {sent}/{len(events)} key events")
+
 
 # UI actions
+#
+# Each action type has a compiler that reads and validates the action's fields
+# once and returns a zero-argument step, so a script can be compiled at load
+# time and re-run without any per-step dict lookups. Invalid actions raise
+# ValueError at compile time.
 
-def execute_type_text(action):
-    """Type text action with completion verification"""
+def _compile_type_text(action):
     text = action.get('text', '')
-    pyautogui.typewrite(text)
-    time.sleep(0.5)
-    
-    # Verify completion
-    from verification import verify_action_completion
-    return verify_action_completion(action, True)
 
+    def step():
+        _type_text_fast(text)
+        wait_for_input_settled(timeout=0.5)
+        return verify_action_completion(action, True)
+    return step
 
-def execute_hotkey(action):
-    """Execute hotkey action with completion verification"""
-    keys = action.get('keys', [])
+
+def _compile_hotkey(action):
+    keys = tuple(action.get('keys', []))
     if not keys:
-        return False
-    pyautogui.hotkey(*keys)
-    time.sleep(0.1)  # Reduced from 0.5s to 0.1s for faster execution
-    
-    # Verify completion
-    from verification import verify_action_completion
-    return verify_action_completion(action, True)
+        raise ValueError("No keys specified for hotkey action")
+    press_hotkey = functools.partial(pyautogui.hotkey, *keys)
 
+    def step():
+        press_hotkey()
+        wait_for_input_settled(timeout=0.1)
+        return verify_action_completion(action, True)
+    return step
 
-def execute_key_press(action):
-    """Press single key with completion verification"""
+
+def _compile_key_press(action):
     key = action.get('key')
     if not key:
-        return False
-    pyautogui.press(key)
-    time.sleep(0.5)
-    
-    # Verify completion
-    from verification import verify_action_completion
-    return verify_action_completion(action, True)
+        raise ValueError("No key specified for key_press action")
 
+    def step():
+        pyautogui.press(key)
+        wait_for_input_settled(timeout=0.5)
+        return verify_action_completion(action, True)
+    return step
 
-def execute_wait(action):
-    """Wait/sleep for specified duration with completion verification"""
+
+def _compile_wait(action):
     duration = action.get('duration', 1)
-    time.sleep(duration)
-    
-    # Verify completion
-    from verification import verify_action_completion
-    return verify_action_completion(action, True)
 
+    def step():
+        time.sleep(duration)
+        return verify_action_completion(action, True)
+    return step
 
-def execute_click_image(action):
-    """Find and click on an image/template with completion verification"""
+
+def _compile_click_image(action):
     template_path = action.get('template')
-    confidence = action.get('confidence', 0.8)
-    offset_x = action.get('offset_x', 0)
-    offset_y = action.get('offset_y', 0)
-    
     if not template_path:
-        print("No template path specified")
-        return False
-    
-    """Wait for screen stability before clicking"""
-    from verification import verify_screen_stable
-    if not verify_screen_stable(timeout=2):
-        print("Screen is not stable, skipping click")
-
-    # Use ui_detection module
-    result = ui_detection.find_and_click_template(
+        raise ValueError("No template path specified")
+    find_and_click = functools.partial(
+        ui_detection.find_and_click_template,
         template_path,
-        threshold=confidence,
-        offset_x=offset_x,
-        offset_y=offset_y
+        threshold=action.get('confidence', 0.8),
+        offset_x=action.get('offset_x', 0),
+        offset_y=action.get('offset_y', 0)
     )
-    
-    # Verify completion
-    from verification import verify_action_completion
-    return verify_action_completion(action, result)
 
+    def step():
+        # Wait for screen stability before clicking
+        if not verify_screen_stable(timeout=2):
+            print("Screen is not stable, skipping click")
+        return verify_action_completion(action, find_and_click())
+    return step
 
-def execute_click_text(action):
-    """Find and click on text using OCR with completion verification"""
+
+def _compile_click_text(action):
     text = action.get('text')
-    region = action.get('region')  # Optional region to search
-    use_smart_crop = action.get('use_smart_crop', True)  # Enable smart cropping by default
-    text_hint = action.get('text_hint')  # Optional hint about text location
-    confidence_threshold = action.get('confidence', 0.8)
-    
     if not text:
-        print("No text specified for click_text action")
-        return False
-    
-    try:
-        # Use OCR-based text detection with smart cropping
-        result = ui_detection.find_text_unified(
-            text=text,
-            region=region,
-            use_smart_crop=use_smart_crop,
-            text_hint=text_hint,
-            click_after_find=True,
-            delay=0.5
-        )
-        
-        # Verify completion
-        from verification import verify_action_completion
-        success = result.get('found', False)
-        return verify_action_completion(action, success)
-            
-    except Exception as e:
-        print(f"Error in click_text: {e}")
-        return False
+        raise ValueError("No text specified for click_text action")
+    # OCR-based text detection with smart cropping (enabled by default)
+    find_and_click = functools.partial(
+        ui_detection.find_text_unified,
+        text=text,
+        region=action.get('region'),
+        use_smart_crop=action.get('use_smart_crop', True),
+        text_hint=action.get('text_hint'),
+        click_after_find=True,
+        delay=0.5
+    )
 
+    def step():
+        try:
+            result = find_and_click()
+            return verify_action_completion(action, result.get('found', False))
+        except Exception as e:
+            print(f"Error in click_text: {e}")
+            return False
+    return step
 
-def execute_verify_text(action):
-    """Verify text is present on screen using OCR with completion verification"""
+
+def _compile_verify_text(action):
     text = action.get('text')
-    region = action.get('region')
-    confidence_threshold = action.get('confidence', 0.8)
-    
     if not text:
-        print("No text specified for verify_text action")
-        return False
-    
-    try:
-        # Use OCR to verify text presence
-        result = ui_detection.verify_text_present(
-            text=text,
-            region=region,
-            confidence_threshold=confidence_threshold
-        )
-        
-        # Verify completion (for verify_text, the result IS the completion)
-        from verification import verify_action_completion
-        return verify_action_completion(action, result)
-        
-    except Exception as e:
-        print(f"Error in verify_text: {e}")
-        return False
+        raise ValueError("No text specified for verify_text action")
+    verify_text = functools.partial(
+        ui_detection.verify_text_present,
+        text=text,
+        region=action.get('region'),
+        confidence_threshold=action.get('confidence', 0.8)
+    )
 
+    def step():
+        try:
+            # For verify_text, the result IS the completion
+            return verify_action_completion(action, verify_text())
+        except Exception as e:
+            print(f"Error in verify_text: {e}")
+            return False
+    return step
 
-def execute_wait_for_text(action):
-    """Wait for text to appear using OCR with completion verification"""
+
+def _compile_wait_for_text(action):
     text = action.get('text')
-    timeout = action.get('timeout', 10)
-    region = action.get('region')
-    confidence_threshold = action.get('confidence', 0.8)
-    check_interval = action.get('check_interval', 0.5)
-    
     if not text:
-        print("No text specified for wait_for_text action")
-        return False
-    
-    try:
-        # Use OCR to wait for text
-        result = ui_detection.wait_for_text(
-            text=text,
-            timeout=timeout,
-            region=region,
-            confidence_threshold=confidence_threshold,
-            check_interval=check_interval
-        )
-        
-        # Verify completion (for wait_for_text, the result IS the completion)
-        from verification import verify_action_completion
-        return verify_action_completion(action, result)
-        
-    except Exception as e:
-        print(f"Error in wait_for_text: {e}")
-        return False
+        raise ValueError("No text specified for wait_for_text action")
+    wait_for_text = functools.partial(
+        ui_detection.wait_for_text,
+        text=text,
+        timeout=action.get('timeout', 10),
+        region=action.get('region'),
+        confidence_threshold=action.get('confidence', 0.8),
+        check_interval=action.get('check_interval', 0.5)
+    )
 
+    def step():
+        try:
+            # For wait_for_text, the result IS the completion
+            return verify_action_completion(action, wait_for_text())
+        except Exception as e:
+            print(f"Error in wait_for_text: {e}")
+            return False
+    return step
 
-def execute_close_window(action):
-    """Close window by clicking the X button with completion verification"""
+
+def _compile_close_window(action):
     app_name = action.get('app_name', 'Notepad')
+
+    def step():
+        window = find_window(app_name)
+        if not window:
+            print(f"Window {app_name} not found")
+            return False
+
+        try:
+            # Ask the window to close itself (pygetwindow posts WM_CLOSE to its
+            # hwnd) - no dependence on where the title bar's X button is drawn
+            print(f"Sending close request to '{window.title}'")
+            window.close()
+            invalidate_window(app_name)
+
+            # Give the app a moment to tear the window down (or raise a save prompt)
+            hwnd = getattr(window, '_hWnd', None)
+            if hwnd:
+                user32 = ctypes.windll.user32
+                wait_until(lambda: not user32.IsWindow(hwnd), timeout=0.5)
+
+            return verify_action_completion(action, True)
+
+        except Exception as e:
+            print(f"Error in close_window: {e}")
+            return False
+    return step
+
+
+class ActionType(IntEnum):
+    """Action types, numbered to index ACTION_COMPILERS"""
+    TYPE_TEXT = 0
+    HOTKEY = 1
+    KEY_PRESS = 2
+    WAIT = 3
+    CLICK_IMAGE = 4
+    CLICK_TEXT = 5
+    VERIFY_TEXT = 6
+    WAIT_FOR_TEXT = 7
+    CLOSE_WINDOW = 8
+
+
+# Script type strings ('type_text', ...) to ActionType, resolved once per action.
+# Keys are interned, like the type strings config.load_instructions hands out.
+ACTION_TYPE_IDS = {sys.intern(action_type.name.lower()): action_type for action_type in ActionType}
+
+# Indexed by ActionType
+ACTION_COMPILERS = (
+    _compile_type_text,
+    _compile_hotkey,
+    _compile_key_press,
+    _compile_wait,
+    _compile_click_image,
+    _compile_click_text,
+    _compile_verify_text,
+    _compile_wait_for_text,
+    _compile_close_window,
+)
+
+
+def action_type_id(action):
+    """Resolve an action's type string to its ActionType
     
-    # Find the window
-    window = find_window(app_name)
-    if not window:
-        print(f"Window {app_name} not found")
-        return False
+    Args:
+        action: Action dictionary
+        
+    Returns:
+        ActionType, or None for unknown types
+    """
+    return ACTION_TYPE_IDS.get(action.get('type'))
+
+
+def compile_action(action):
+    """Compile one action into a zero-argument step
     
-    try:
-        # Get window position and size
-        x, y, width = window.left, window.top, window.width
+    Args:
+        action: Action dictionary
         
-        # X button is typically at top-right corner
-        # Offset from right edge: ~15px, from top: ~15px
-        close_x = x + width - 15
-        close_y = y + 15
+    Returns:
+        Zero-argument callable running the action and returning bool
         
-        print(f"Clicking close button at ({close_x}, {close_y})")
-        pyautogui.click(close_x, close_y)
-        time.sleep(0.5)
+    Raises:
+        ValueError: If the action type is unknown or a required field is missing
+    """
+    type_id = action_type_id(action)
+    if type_id is None:
+        raise ValueError(f"Unknown action type: {action.get('type')}")
+    return ACTION_COMPILERS[type_id](action)
+
+
+# id(actions) -> (actions, steps). Action lists come from the shared instructions
+# cache and are never modified, so each script is compiled once per process.
+_COMPILED_SCRIPTS = {}
+
+
+def compile_actions(actions):
+    """Compile a whole action script up front, validating every action
+    
+    Args:
+        actions: List of action dictionaries
         
-        # Verify completion
-        from verification import verify_action_completion
-        return verify_action_completion(action, True)
+    Returns:
+        Tuple of zero-argument steps, one per action
         
-    except Exception as e:
-        print(f"Error in close_window: {e}")
+    Raises:
+        ValueError: Naming the first invalid action
+    """
+    cached = _COMPILED_SCRIPTS.get(id(actions))
+    if cached is not None and cached[0] is actions:
+        return cached[1]
+
+    steps = []
+    for i, action in enumerate(actions):
+        try:
+            steps.append(compile_action(action))
+        except ValueError as e:
+            raise ValueError(f"Action {i+1} ({action.get('type')}): {e}")
+    steps = tuple(steps)
+    if steps:
+        _COMPILED_SCRIPTS[id(actions)] = (actions, steps)
+    return steps
+
+
+def _run_compiled(compiler, action):
+    """Compile and run a single action, reporting invalid actions as failures"""
+    try:
+        step = compiler(action)
+    except ValueError as e:
+        print(e)
         return False
+    return step()
+
+
+def execute_type_text(action):
+    """Type text action with completion verification"""
+    return _run_compiled(_compile_type_text, action)
+
+
+def execute_hotkey(action):
+    """Execute hotkey action with completion verification"""
+    return _run_compiled(_compile_hotkey, action)
+
+
+def execute_key_press(action):
+    """Press single key with completion verification"""
+    return _run_compiled(_compile_key_press, action)
+
+
+def execute_wait(action):
+    """Wait/sleep for specified duration with completion verification"""
+    return _run_compiled(_compile_wait, action)
+
+
+def execute_click_image(action):
+    """Find and click on an image/template with completion verification"""
+    return _run_compiled(_compile_click_image, action)
+
+
+def execute_click_text(action):
+    """Find and click on text using OCR with completion verification"""
+    return _run_compiled(_compile_click_text, action)
+
+
+def execute_verify_text(action):
+    """Verify text is present on screen using OCR with completion verification"""
+    return _run_compiled(_compile_verify_text, action)
+
+
+def execute_wait_for_text(action):
+    """Wait for text to appear using OCR with completion verification"""
+    return _run_compiled(_compile_wait_for_text, action)
+
+
+def execute_close_window(action):
+    """Close window by posting WM_CLOSE to it with completion verification"""
+    return _run_compiled(_compile_close_window, action)
+
+
+# Action types that click something on screen (interned like ACTION_TYPE_IDS)
+CLICK_ACTION_TYPES = frozenset(map(sys.intern, ('click_image', 'click_text')))
 
+# Action types that act on a screen target (clicks, plus closing a window),
+# worked out once from the dispatch table
+CLICK_HANDLERS = tuple(name for name in ACTION_TYPE_IDS if name in CLICK_ACTION_TYPES or name == 'close_window')
 
-# Action dispatcher using dictionary
-ACTION_HANDLERS = {
-    'type_text': execute_type_text,
-    'hotkey': execute_hotkey,
-    'key_press': execute_key_press,
-    'wait': execute_wait,
-    'click_image': execute_click_image,
-    'click_text': execute_click_text,
-    'verify_text': execute_verify_text,
-    'wait_for_text': execute_wait_for_text,
-    'close_window': execute_close_window,
-}
 
 def execute_action(action):
     """Execute any action type"""
-    action_type = action.get('type')
-    handler = ACTION_HANDLERS.get(action_type)
-    
-    if handler:
-        return handler(action)
+    return _run_compiled(compile_action, action)
+
+
+# Text checks that only read the screen, so neighbouring ones can run side by side
+READ_ONLY_ACTION_TYPES = frozenset(map(sys.intern, ('verify_text', 'wait_for_text')))
+
+_read_only_pool = None
+
+
+def _get_read_only_pool():
+    """Create the worker pool for read-only actions on first use"""
+    global _read_only_pool
+    if _read_only_pool is None:
+        # Tesseract runs single-threaded (OMP_THREAD_LIMIT=1), so one worker per core
+        _read_only_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+    return _read_only_pool
+
+
+def execute_actions_parallel(actions):
+    """Execute independent read-only actions (see READ_ONLY_ACTION_TYPES) concurrently
     
-    print(f"Unknown action type: {action_type}")
-    return False
+    Args:
+        actions: List of read-only actions
+        
+    Returns:
+        List of bool results, in the same order as actions
+    """
+    pool = _get_read_only_pool()
+    futures = [pool.submit(execute_action, action) for action in actions]
+    return [future.result() for future in futures]
+
 
 
 
@@ -3,12 +3,13 @@ App Preparation Module
 Handles application launching, maximizing, and verification
 """
 
-from .app_launcher import launch_application
+from .app_launcher import launch_application, ProcessSnapshot
 from .app_maximizer import maximize_application
 from .app_verifier import verify_application_ready
 
 __all__ = [
     'launch_application',
+    'ProcessSnapshot',
     'maximize_application', 
     'verify_application_ready'
 ]
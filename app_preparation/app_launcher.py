@@ -5,125 +5,266 @@ Following clean workflow steps with proper error handling
 """
 
 import time
-import subprocess
-import psutil
 import shutil
 import os
-from window_ops import find_window, launch_app
+import logging
+import threading
+from window_ops import find_window, launch_app, INPUT_LOCK
 from notifications import notify_error
-import pyautogui
+from utils import wait_until
+
+# Per-attempt and per-process chatter goes through logging so it costs nothing
+# when filtered out; outcomes ([OK]/[FAIL]/[ERROR]) are still printed
+logger = logging.getLogger(__name__)
+
+
+# is_spotify_running result reused for this many seconds, so retry loops
+# don't rescan the process table on every check
+_SPOTIFY_CHECK_TTL = 1.0
+_spotify_check = {'time': 0.0, 'result': False}
+
+
+# On Linux a process name is a single short read from procfs
+_PROC_COMM = '/proc/{}/comm' if os.path.isdir('/proc/self') else None
+
+
+def _process_name(psutil, pid):
+    """Get a process name, reading /proc/<pid>/comm directly where it exists"""
+    if _PROC_COMM is not None:
+        try:
+            with open(_PROC_COMM.format(pid), 'rb') as f:
+                return f.read().decode(errors='replace').rstrip('\n')
+        except FileNotFoundError:
+            raise psutil.NoSuchProcess(pid)
+        except OSError:
+            pass
+    return psutil.Process(pid).name()
+
+
+def _forget_spotify_check():
+    """Drop the cached is_spotify_running result (after starting Spotify)"""
+    _spotify_check['time'] = 0.0
 
 
 def is_spotify_running():
     """Check if Spotify process is running"""
+    now = time.monotonic()
+    if now - _spotify_check['time'] < _SPOTIFY_CHECK_TTL:
+        return _spotify_check['result']
+
+    import psutil
+
+    result = False
     try:
-        for proc in psutil.process_iter(['pid', 'name']):
-            if proc.info['name'] and 'spotify' in proc.info['name'].lower():
-                return True
-        return False
+        # Only fetch each process's name, and stop at the first match
+        for pid in psutil.pids():
+            try:
+                if 'spotify' in _process_name(psutil, pid).lower():
+                    result = True
+                    break
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
     except Exception as e:
-        print(f"  [WARN] Error checking Spotify process: {e}")
+        logger.warning("  [WARN] Error checking Spotify process: %s", e)
         return False
 
+    _spotify_check['time'] = now
+    _spotify_check['result'] = result
+    return result
+
+
+# Successful resolve_app_path results - an installed app doesn't move mid-run
+_RESOLVED_PATHS = {}
+
+
+def _search_path(app_path):
+    """Look for app_path in the current directory and PATH, trying each PATHEXT extension"""
+    extensions = [''] + os.environ.get('PATHEXT', '.EXE;.BAT;.CMD').split(os.pathsep)
+    directories = [os.getcwd()] + os.environ.get('PATH', '').split(os.pathsep)
+    for directory in directories:
+        if not directory:
+            continue
+        base = os.path.join(directory, app_path)
+        for ext in extensions:
+            candidate = base + ext
+            if os.path.isfile(candidate):
+                return candidate
+    return None
+
 
 def resolve_app_path(app_path):
-    """Resolve an application path: expand vars, check existence, which/where lookup."""
+    """Resolve an application path: expand vars, check existence, which/PATH lookup."""
     if not app_path:
         return None
 
+    cached = _RESOLVED_PATHS.get(app_path)
+    if cached:
+        return cached
+
+    resolved = None
     try:
-        # Expand env vars and user
-        expanded = os.path.expandvars(os.path.expanduser(app_path))
+        # Expand env vars and user (only when the path actually uses them)
+        expanded = app_path
+        if '~' in expanded:
+            expanded = os.path.expanduser(expanded)
+        if '$' in expanded or '%' in expanded:
+            expanded = os.path.expandvars(expanded)
         if os.path.isabs(expanded) and os.path.exists(expanded):
-            return expanded
-
-        # Try shutil.which for executables in PATH
-        which_found = shutil.which(app_path)
-        if which_found:
-            return which_found
-
-        # On Windows try 'where' as a last resort
-        try:
-            res = subprocess.run(['where', app_path], capture_output=True, text=True, timeout=5)
-            if res.returncode == 0 and res.stdout:
-                first = res.stdout.splitlines()[0].strip()
-                if os.path.exists(first):
-                    return first
-        except Exception:
-            pass
+            resolved = expanded
+        else:
+            # Try shutil.which for executables in PATH, then a plain walk of
+            # the current directory and PATH (what 'where' would search)
+            resolved = shutil.which(app_path) or _search_path(app_path)
 
     except Exception as e:
         print(f"  [WARN] Error resolving app path: {e}")
 
-    return None
+    if resolved:
+        _RESOLVED_PATHS[app_path] = resolved
+    return resolved
 
 
-def is_process_running_for_path(exec_path):
-    """Check running processes to find one matching exec_path (by absolute path or basename)."""
-    if not exec_path:
-        return False
+class ProcessSnapshot:
+    """One pass over the process table, shared by several running-process checks
+
+    Every process's name is read on the first query; exe/cmdline are only read
+    (in one oneshot batch) for processes whose name could match a query, and
+    are then remembered. Query it before launching anything - it doesn't see
+    processes started after the scan.
+    """
+
+    def __init__(self):
+        self._by_name = None
+        self._by_stem = {}
+        self._procs = {}
+        self._paths = {}
+        # prepare_applications queries one snapshot from several threads
+        self._scan_lock = threading.Lock()
+
+    @property
+    def by_name(self):
+        """Lowercase process name -> list of pids (scanned on first use)"""
+        if self._by_name is None:
+            with self._scan_lock:
+                if self._by_name is None:
+                    self._scan()
+        return self._by_name
+
+    def _scan(self):
+        """Read every process name, publishing the finished indexes in one step"""
+        import psutil
+        by_name = {}
+        procs = {}
+        try:
+            for proc in psutil.process_iter(['name']):
+                name = (proc.info.get('name') or '').lower()
+                if name:
+                    by_name.setdefault(name, []).append(proc.pid)
+                    procs[proc.pid] = proc
+        except Exception as e:
+            logger.warning("  [WARN] Error scanning processes: %s", e)
+
+        # Extension-less names, computed once for the prefix pruning below
+        by_stem = {}
+        for name, pids in by_name.items():
+            stem = os.path.splitext(name)[0]
+            if stem:
+                by_stem.setdefault(stem, []).extend(pids)
+
+        self._procs = procs
+        self._by_stem = by_stem
+        # Assigned last - other threads only read the indexes once this is set
+        self._by_name = by_name
+
+    def has_process_named(self, fragment):
+        """Check whether any process name contains fragment (case-insensitive)"""
+        fragment = fragment.lower()
+        return any(fragment in name for name in self.by_name)
+
+    def _exe_and_cmdline(self, pid):
+        """(exe, cmdline) for a pid, read once in a single oneshot batch"""
+        if pid not in self._paths:
+            exe, cmdline = None, []
+            proc = self._procs[pid]
+            try:
+                with proc.oneshot():
+                    exe = proc.exe()
+                    cmdline = proc.cmdline()
+            except Exception:
+                # Gone, zombie or access denied - treat as unreadable
+                pass
+            self._paths[pid] = (exe, cmdline)
+        return self._paths[pid]
+
+    def has_process_for_path(self, exec_path):
+        """Check for a process matching exec_path (by absolute path or basename)"""
+        if not exec_path:
+            return False
 
-    try:
         norm_target = None
         if os.path.isabs(exec_path):
             try:
-                norm_target = os.path.normcase(os.path.abspath(exec_path))
+                norm_target = os.path.normcase(os.path.normpath(exec_path))
             except Exception:
                 norm_target = None
 
+        # The name field is already the image's basename, so most checks end here
         target_basename = os.path.basename(exec_path).lower()
+        if target_basename in self.by_name:
+            return True
 
-        for proc in psutil.process_iter(['pid', 'exe', 'cmdline', 'name']):
+        def _matches(path):
+            if not path:
+                return False
+            if os.path.basename(path).lower() == target_basename:
+                return True
+            if not norm_target or not os.path.isabs(path):
+                return False
             try:
-                exe = proc.info.get('exe')
-                if exe:
-                    try:
-                        exe_norm = os.path.normcase(os.path.abspath(exe))
-                    except Exception:
-                        exe_norm = None
-                    if norm_target and exe_norm == norm_target:
-                        return True
-                    if os.path.basename(exe).lower() == target_basename:
-                        return True
-
-                # Fallback: check cmdline[0]
-                cmd = proc.info.get('cmdline')
-                if cmd and len(cmd) > 0:
-                    cmd0 = cmd[0]
-                    if os.path.isabs(cmd0):
-                        try:
-                            cmd0_norm = os.path.normcase(os.path.abspath(cmd0))
-                        except Exception:
-                            cmd0_norm = None
-                        if norm_target and cmd0_norm == norm_target:
-                            return True
-                    if os.path.basename(cmd0).lower() == target_basename:
-                        return True
+                return os.path.normcase(os.path.normpath(path)) == norm_target
+            except Exception:
+                return False
 
-                # Last resort: compare process name
-                name = proc.info.get('name')
-                if name and name.lower() == target_basename:
+        # Process names are the image name (truncated on some platforms), so a
+        # process can only match if its name and the target's stem share a prefix
+        target_stem = os.path.splitext(target_basename)[0][:15]
+        for name_stem, pids in self._by_stem.items():
+            if not (name_stem.startswith(target_stem) or target_stem.startswith(name_stem)):
+                continue
+            for pid in pids:
+                exe, cmdline = self._exe_and_cmdline(pid)
+                # Fall back to cmdline[0] when exe isn't readable
+                if _matches(exe) or (cmdline and _matches(cmdline[0])):
                     return True
+        return False
 
-            except Exception:
-                continue
-    except Exception as e:
-        print(f"  [WARN] Error scanning processes: {e}")
 
-    return False
+def is_process_running_for_path(exec_path, snapshot=None):
+    """Check running processes to find one matching exec_path (by absolute path or basename).
+
+    Pass a ProcessSnapshot to reuse one scan across several checks.
+    """
+    if not exec_path:
+        return False
+    if snapshot is None:
+        snapshot = ProcessSnapshot()
+    return snapshot.has_process_for_path(exec_path)
 
 
 def click_spotify_icon():
     """Open Spotify using Windows search - SIMPLE"""
+    import pyautogui
+
     try:
         print("  [INFO] Opening Spotify via Windows search...")
         # Use Windows key + search (most reliable)
-        pyautogui.hotkey('win')
-        time.sleep(1)
-        pyautogui.typewrite('spotify', interval=0.1)
-        time.sleep(1)
-        pyautogui.press('enter')
-        time.sleep(4)  # Give it time to launch
+        with INPUT_LOCK:
+            pyautogui.hotkey('win')
+            time.sleep(1)
+            pyautogui.write('spotify', interval=0)
+            time.sleep(1)
+            pyautogui.press('enter')
+        # The caller waits for the window rather than sleeping a fixed launch time
         return True
     except Exception as e:
         print(f"  [WARN] Windows search method failed: {e}")
@@ -144,9 +285,35 @@ def safe_find_window(app_name):
         return None
 
 
-def launch_application(app_name, app_config, max_retries=3):
+# How long to look for a freshly launched app's window
+WINDOW_WAIT_TIMEOUT = 5
+
+# Pause between launch retries: RETRY_BACKOFF_BASE * 2**attempt seconds, capped
+RETRY_BACKOFF_BASE = 0.2
+RETRY_BACKOFF_MAX = 2.0
+
+
+def wait_for_window(app_name, timeout=WINDOW_WAIT_TIMEOUT, initial=0.05):
+    """Wait for an app's window to appear, checking quickly at first then backing off
+    
+    Args:
+        app_name: Application name to look for
+        timeout: Maximum seconds to wait
+        initial: Seconds before the second check (grows 1.5x per check, up to 0.5 s)
+        
+    Returns:
+        True as soon as the window is found, False on timeout
+    """
+    return wait_until(lambda: safe_find_window(app_name), timeout=timeout,
+                      interval=initial, backoff=1.5, max_interval=0.5)
+
+
+def launch_application(app_name, app_config, max_retries=3, snapshot=None):
     """Get Application ready for action - with proper error handling.
 
+    Pass a ProcessSnapshot taken up front to reuse one process scan for the
+    "already running?" checks across several apps.
+
     Returns True if the application is ready (either already open or launched successfully),
     or False if it could not be ensured running.
     """
@@ -158,13 +325,21 @@ def launch_application(app_name, app_config, max_retries=3):
 
     print(f"Checking if {app_name} is already open...")
 
+    # Read the app's settings once up front instead of inside the retry loops.
+    # process_presence_sufficient defaults to True (backwards compatible).
+    has_config = isinstance(app_config, dict)
+    cfg = app_config if has_config else {}
+    config_path = cfg.get('path')
+    launch_args = cfg.get('args')
+    process_presence_sufficient = bool(cfg.get('process_presence_sufficient', True))
+
     # Resolve path from config
     resolved_path = None
-    if app_config and app_config.get('path'):
+    if config_path:
         try:
-            resolved_path = resolve_app_path(app_config.get('path'))
+            resolved_path = resolve_app_path(config_path)
             if resolved_path:
-                print(f"  [INFO] Resolved app path: {resolved_path}")
+                logger.info("  [INFO] Resolved app path: %s", resolved_path)
         except Exception as e:
             print(f"  [WARN] Could not resolve path: {e}")
             resolved_path = None
@@ -177,45 +352,28 @@ def launch_application(app_name, app_config, max_retries=3):
 
     # Check if process is running (might be open but window not detected)
     if resolved_path:
-        print(f"  [INFO] Checking for running process...")
-        if is_process_running_for_path(resolved_path):
+        logger.info("  [INFO] Checking for running process...")
+        if is_process_running_for_path(resolved_path, snapshot):
             print(f"  [OK] Found running process for {app_name}")
-            # Give it a few chances to find the window
-            for i in range(3):
-                time.sleep(1)
-                window = safe_find_window(app_name)
-                if window:
-                    print(f"[OK] {app_name} window found after {i+1} check(s)")
-                    return True
+            # Give the window a few seconds to show up
+            if wait_for_window(app_name, timeout=3):
+                print(f"[OK] {app_name} window found")
+                return True
             # If the process is running but window wasn't found, only treat as available
             # if the app_config indicates process presence is sufficient.
-            try:
-                if isinstance(app_config, dict) and app_config.get('process_presence_sufficient', True):
-                    print(f"  [WARN] Process running but window not visible - treating as available")
-                    return True
-                else:
-                    print(f"  [WARN] Process running but window not visible - will attempt to surface window")
-            except Exception:
+            if has_config and process_presence_sufficient:
                 print(f"  [WARN] Process running but window not visible - treating as available")
                 return True
+            print(f"  [WARN] Process running but window not visible - will attempt to surface window")
 
     # SPOTIFY SPECIFIC LAUNCH LOGIC
     if app_name.lower() == 'spotify':
         print(f"Opening Spotify...")
 
-        # Decide whether process presence should be treated as sufficient.
-        # This is configurable per-app via `process_presence_sufficient` in the app's config.
-        # Default behavior: True (backwards compatible).
-        process_presence_sufficient = True
-        try:
-            if isinstance(app_config, dict) and 'process_presence_sufficient' in app_config:
-                process_presence_sufficient = bool(app_config.get('process_presence_sufficient'))
-        except Exception:
-            process_presence_sufficient = True
-
         # If process is already running and the config says that's sufficient, return True
         try:
-            if process_presence_sufficient and is_spotify_running():
+            spotify_running = snapshot.has_process_named('spotify') if snapshot else is_spotify_running()
+            if process_presence_sufficient and spotify_running:
                 print(f"  [INFO] Spotify process detected - treating process presence as sufficient")
                 return True
         except Exception:
@@ -230,18 +388,13 @@ def launch_application(app_name, app_config, max_retries=3):
             while attempts_done < max_attempts:
                 attempts_done += 1
                 try:
-                    print(f"  [ATTEMPT {attempts_done}/{max_attempts}] Launching via executable: {resolved_path}")
-                    startup_delay = app_config.get('startup_delay', 3) if app_config else 3
-                    launch_app(resolved_path, startup_delay)
-                    # Wait for Spotify to start and surface a window
-                    time.sleep(startup_delay)
-
-                    for check in range(5):
-                        window = safe_find_window('Spotify')
-                        if window:
-                            print(f"[OK] Spotify opened successfully via executable")
-                            return True
-                        time.sleep(1)
+                    logger.info("  [ATTEMPT %d/%d] Launching via executable: %s", attempts_done, max_attempts, resolved_path)
+                    launch_app(resolved_path, cfg.get('startup_delay', 3))
+                    _forget_spotify_check()
+                    # Poll for Spotify to surface a window
+                    if wait_for_window('Spotify'):
+                        print(f"[OK] Spotify opened successfully via executable")
+                        return True
 
                     # If process exists now, treat as available only if toggle allows it
                     try:
@@ -264,19 +417,18 @@ def launch_application(app_name, app_config, max_retries=3):
                         print(f"  [INFO] Spotify process detected during attempts - treating as sufficient")
                         return True
                     else:
-                        print(f"  [INFO] Spotify process detected during attempts - config requires window; continuing attempts")
+                        logger.info("  [INFO] Spotify process detected during attempts - config requires window; continuing attempts")
             except Exception:
                 pass
 
             attempts_done += 1
-            print(f"  [ATTEMPT {attempts_done}/{max_attempts}] Using Windows search fallback...")
+            logger.info("  [ATTEMPT %d/%d] Using Windows search fallback...", attempts_done, max_attempts)
             if click_spotify_icon():
-                for check in range(5):
-                    window = safe_find_window('Spotify')
-                    if window:
-                        print(f"[OK] Spotify opened successfully via Windows search")
-                        return True
-                    time.sleep(1)
+                _forget_spotify_check()
+                # click_spotify_icon no longer sleeps for the launch, so allow for that here
+                if wait_for_window('Spotify', timeout=WINDOW_WAIT_TIMEOUT + 4):
+                    print(f"[OK] Spotify opened successfully via Windows search")
+                    return True
 
                 try:
                     if process_presence_sufficient and is_spotify_running():
@@ -293,42 +445,38 @@ def launch_application(app_name, app_config, max_retries=3):
     # GENERIC APPLICATION LAUNCH (non-Spotify)
     print(f"{app_name} not found, launching...")
     
+    launch_path = resolved_path or config_path
+    startup_delay = cfg.get('startup_delay', 2)
+
     for attempt in range(1, max_retries + 1):
-        print(f"  Launch attempt {attempt}/{max_retries}")
+        logger.info("  Launch attempt %d/%d", attempt, max_retries)
         
         try:
-            launch_path = resolved_path or (app_config.get('path') if app_config else None)
-            launch_args = app_config.get('args') if app_config else None
-            startup_delay = app_config.get('startup_delay', 2) if app_config else 2
-
             if not launch_path:
                 print(f"[ERROR] No launch path available for {app_name}")
                 break
 
-            # Launch the application
+            # Launch the application (returns once it is ready for input)
             launch_app(launch_path, startup_delay, launch_args)
             
-            # Wait for it to start
-            time.sleep(startup_delay)
-            
-            # Check if window appeared (multiple attempts)
-            for check in range(5):
-                window = safe_find_window(app_name)
-                if window:
-                    print(f"[OK] {app_name} successfully launched on attempt {attempt}")
-                    return True
-                if check < 4:
-                    time.sleep(1)
+            # Poll for the window to appear
+            if wait_for_window(app_name):
+                print(f"[OK] {app_name} successfully launched on attempt {attempt}")
+                return True
             
             print(f"[WARN] {app_name} not found after launch attempt {attempt}")
 
         except Exception as e:
             print(f"[ERROR] Launch attempt {attempt} failed: {str(e)}")
 
-        # Wait before retry
+        # Wait before retry, backing off exponentially - but stop early if the
+        # window turns up late from the last attempt
         if attempt < max_retries:
-            print(f"  Waiting before retry...")
-            time.sleep(2)
+            retry_delay = min(RETRY_BACKOFF_BASE * (2 ** attempt), RETRY_BACKOFF_MAX)
+            logger.info("  Waiting up to %.1fs before retry...", retry_delay)
+            if wait_for_window(app_name, timeout=retry_delay):
+                print(f"[OK] {app_name} window appeared after launch attempt {attempt}")
+                return True
 
     # All attempts exhausted
     print(f"[FAIL] Failed to launch {app_name} after {max_retries} attempts")
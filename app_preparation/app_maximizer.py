@@ -4,29 +4,35 @@ Handles maximizing the application and verifying it's maximized
 """
 
 import time
-from window_ops import find_window, maximize_window, is_window_maximized
-from ui_detection import find_template, detect_screen_change
+from window_ops import find_window, maximize_window, is_window_maximized, prepare_window
 from notifications import notify_error
 
 
-def maximize_application(app_name, max_retries=3):
+def maximize_application(app_name, max_retries=3, window=None):
     """
     Maximize the application and verify it's maximized
     
     Args:
         app_name: Name of the application
         max_retries: Maximum number of retry attempts (default: 3)
+        window: Optional window already found for the app (skips the lookup)
     
     Returns:
         bool: True if application is successfully maximized, False otherwise
     """
     print(f"Maximizing {app_name}...")
     
-    window = find_window(app_name)
+    if window is None:
+        window = find_window(app_name)
     if not window:
         print(f"[ERROR] {app_name} window not found")
         return False
     
+    # Fast path: maximize + focus + state check straight on the handle
+    if prepare_window(window) and is_window_maximized(window):
+        print(f"[OK] {app_name} successfully maximized")
+        return True
+    
     for attempt in range(1, max_retries + 1):
         print(f"  Maximize attempt {attempt}/{max_retries}")
         
@@ -72,6 +78,9 @@ def verify_application_maximized_visually(app_name, template_path=None):
     
     print(f"  [VISUAL] Checking if {app_name} is maximized visually...")
     
+    # Only pull in the OpenCV stack when a visual check actually runs
+    from ui_detection import find_template
+
     # Try to find the template
     result = find_template(template_path, threshold=0.8)
     if result:
@@ -4,16 +4,16 @@ Handles checking if application is open and maximized
 """
 
 from window_ops import find_window, is_window_maximized
-from ui_detection import find_template
 
 
-def verify_application_ready(app_name, template_path=None):
+def verify_application_ready(app_name, template_path=None, window=None):
     """
     Check if the application is open and maximized
     
     Args:
         app_name: Name of the application
         template_path: Optional template path for visual verification
+        window: Optional window already found for the app (skips the lookup)
     
     Returns:
         bool: True if application is ready, False otherwise
@@ -21,7 +21,8 @@ def verify_application_ready(app_name, template_path=None):
     print(f"Verifying {app_name} is ready...")
     
     # Check if window exists
-    window = find_window(app_name)
+    if window is None:
+        window = find_window(app_name)
     if not window:
         print(f"[FAIL] {app_name} window not found")
         return False
@@ -54,6 +55,9 @@ def verify_application_maximized_visually(app_name, template_path):
     """
     print(f"  [VISUAL] Checking if {app_name} is maximized visually...")
     
+    # Only pull in the OpenCV stack when a visual check actually runs
+    from ui_detection import find_template
+
     # Try to find the template
     result = find_template(template_path, threshold=0.8)
     if result:
@@ -0,0 +1,108 @@
+"""Screen capture - shared in-memory frame buffer for template matching"""
+import atexit
+import threading
+import cv2
+import numpy as np
+import pyautogui
+
+try:
+    import mss
+except ImportError:
+    mss = None
+
+
+_camera = None
+_camera_unavailable = False
+_camera_lock = threading.Lock()
+
+
+def _get_camera():
+    """Start the background DXGI capture thread on first use
+
+    Returns:
+        Running bettercam camera, or None if bettercam is unavailable
+    """
+    global _camera, _camera_unavailable
+
+    if _camera is not None or _camera_unavailable:
+        return _camera
+
+    with _camera_lock:
+        if _camera is None and not _camera_unavailable:
+            try:
+                import bettercam
+                camera = bettercam.create(output_color="GRAY")
+                camera.start(target_fps=60, video_mode=True)
+                atexit.register(camera.stop)
+                _camera = camera
+            except Exception as e:
+                print(f"[WARN] bettercam capture unavailable ({e}) - falling back to pyautogui")
+                _camera_unavailable = True
+
+    return _camera
+
+
+def get_latest_gray():
+    """Get the latest screen frame as a grayscale image
+
+    The bettercam thread keeps overwriting its frame buffer, so the returned
+    array is a reference to the most recent complete frame - callers should
+    treat it as read-only.
+
+    Returns:
+        2D uint8 numpy array (height, width)
+    """
+    camera = _get_camera()
+    if camera is not None:
+        frame = camera.get_latest_frame()
+        if frame is not None:
+            # GRAY output is (height, width, 1)
+            return frame[:, :, 0] if frame.ndim == 3 else frame
+
+    return cv2.cvtColor(grab_bgra(), cv2.COLOR_BGRA2GRAY)
+
+
+# mss handles are tied to the thread that created them, so keep one per thread
+_mss_local = threading.local()
+
+
+def grab_bgra():
+    """Grab the primary monitor as a BGRA array (mss, or pyautogui if mss is missing)
+    
+    mss hands back its raw capture buffer, which is wrapped without copying -
+    the array is only valid until the next grab on the same thread.
+    
+    Returns:
+        uint8 numpy array (height, width, 4)
+    """
+    if mss is not None:
+        grabber = getattr(_mss_local, 'grabber', None)
+        if grabber is None:
+            grabber = mss.mss()
+            _mss_local.grabber = grabber
+        shot = grabber.grab(grabber.monitors[1])
+        return np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+
+    screenshot = pyautogui.screenshot()
+    return cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGRA)
+
+
+def grab_bgr():
+    """Grab the primary monitor as a BGR array, ready for cv2.imwrite
+
+    Returns:
+        uint8 numpy array (height, width, 3)
+    """
+    return cv2.cvtColor(grab_bgra(), cv2.COLOR_BGRA2BGR)
+
+
+def get_thumbnail(size=(80, 45)):
+    """Get a small area-averaged copy of the latest frame for cheap change checks
+
+    Args:
+        size: (width, height) of the thumbnail
+
+    Returns:
+        2D uint8 numpy array (height, width)
+    """
+    return cv2.resize(get_latest_gray(), size, interpolation=cv2.INTER_AREA)
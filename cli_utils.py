@@ -5,6 +5,10 @@ CLI utility functions for parsing command line arguments and resolving objective
 
 def parse_objective_args(argv_tail):
     """Flatten a list of tokens that may include comma-separated ids into a list of ids."""
+    # Usual case: one id per token, nothing to split
+    if not any(',' in token for token in argv_tail):
+        return [t for t in (token.strip() for token in argv_tail) if t] or None
+
     ids = []
     for token in argv_tail:
         if not token:
@@ -18,19 +22,16 @@ def parse_objective_args(argv_tail):
     return ids or None
 
 
-def resolve_app_for_objective(config, objective_id):
-    """Return app name for a given objective id by scanning the JSON objectives."""
+def resolve_app_for_objective(config, objective_id, instructions=None):
+    """Return app name for a given objective id (pass instructions if they're already loaded)."""
     try:
-        from objectives.json_parser import parse_json_objectives
+        from config import load_instructions, get_objective_app
     except Exception:
         return None
     
     try:
-        all_objs = parse_json_objectives(config)
+        if instructions is None:
+            instructions = load_instructions(config)
+        return get_objective_app(instructions, objective_id)
     except Exception:
         return None
-    
-    for o in all_objs:
-        if o.get('id') == objective_id:
-            return o.get('app')
-    return None
@@ -1,34 +1,125 @@
 import json
+import os
+import sys
+
+try:
+    import orjson
+    _loads = orjson.loads
+    _READ_MODE = 'rb'
+except ImportError:
+    orjson = None
+    _loads = json.loads
+    _READ_MODE = 'r'
+
+# Parsed JSON files keyed by path, re-read only when the file's mtime changes
+_JSON_CACHE = {}
+
+# Lookup dicts built over loaded JSON, keyed by (id(owner), list key, field).
+# The owner is stored with its index so a reused id() can't return a stale one.
+_INDEX_CACHE = {}
+
+
+def _load_json(path, prepare=None):
+    """Load a JSON file, reusing the parsed result until the file changes
+    
+    The returned data is shared between callers - don't modify it.
+    prepare(data), if given, runs once on each fresh parse before it's cached.
+    """
+    mtime = os.path.getmtime(path)
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, _READ_MODE) as f:
+        data = _loads(f.read())
+    if prepare is not None:
+        prepare(data)
+    _JSON_CACHE[path] = (mtime, data)
+    return data
+
+
+def _index_by(owner, list_key, field, last_wins=False):
+    """Build (once per loaded dict) a field -> item lookup over owner[list_key]
+    
+    On duplicate values the first item wins, same as a linear scan would,
+    unless last_wins is set (later definitions override earlier ones).
+    """
+    key = (id(owner), list_key, field, last_wins)
+    cached = _INDEX_CACHE.get(key)
+    if cached is not None and cached[0] is owner:
+        return cached[1]
+
+    items = owner.get(list_key, [])
+    if last_wins:
+        index = {item.get(field): item for item in items}
+    else:
+        index = {}
+        for item in items:
+            index.setdefault(item.get(field), item)
+    _INDEX_CACHE[key] = (owner, index)
+    return index
+
+
+def _objectives_by_app(instructions):
+    """Group objectives by lower-cased app name (once per loaded instructions)"""
+    key = (id(instructions), 'objectives', 'app', 'lower')
+    cached = _INDEX_CACHE.get(key)
+    if cached is not None and cached[0] is instructions:
+        return cached[1]
+
+    groups = {}
+    for objective in instructions.get('objectives', []):
+        groups.setdefault((objective.get('app') or '').lower(), []).append(objective)
+    _INDEX_CACHE[key] = (instructions, groups)
+    return groups
+
+
+def _intern_action_types(instructions):
+    """Intern every action type string so dispatch-table lookups match by identity"""
+    for objective in instructions.get('objectives', []):
+        for action in objective.get('actions', []):
+            action_type = action.get('type')
+            if isinstance(action_type, str):
+                action['type'] = sys.intern(action_type)
+
 
 def load_config(config_path="config/config.json"):
-    """Load main config"""
-    with open(config_path, 'r') as f:
-        return json.load(f)
+    """Load main config (parsed once per process, re-read only when the file changes)"""
+    config = _load_json(config_path)
+    # Build the app name index alongside the parse so get_app_config is a dict hit
+    _index_by(config, 'apps', 'name')
+    return config
 
 
 def load_instructions(config):
     """Load instructions from path in config"""
     instructions_path = config.get('instructions_file', 'config/instructions.json')
-    with open(instructions_path, 'r') as f:
-        return json.load(f)
+    instructions = _load_json(instructions_path, prepare=_intern_action_types)
+    # Build the objective id index alongside the parse, like load_config does for apps.
+    # A repeated objective id overrides the earlier definition, as in filter_supported_objectives.
+    _index_by(instructions, 'objectives', 'id', last_wins=True)
+    return instructions
 
 
-def get_objectives(config, objective_ids=None):
-    """Get objectives"""
-    instructions = load_instructions(config)
-    objectives = instructions['objectives']
+def get_objectives(config, objective_ids=None, instructions=None):
+    """Get objectives (pass instructions if they're already loaded)
+    
+    With objective_ids, objectives come back in the requested order and
+    unknown ids are skipped; otherwise in file order.
+    """
+    if instructions is None:
+        instructions = load_instructions(config)
     
     if objective_ids:
-        filtered_objectives = []
-        for o in objectives:
-            if o['id'] in objective_ids:
-                filtered_objectives.append(o)
-        objectives = filtered_objectives
+        by_id = _index_by(instructions, 'objectives', 'id', last_wins=True)
+        objectives = [by_id[oid] for oid in objective_ids if oid in by_id]
+    else:
+        objectives = instructions['objectives']
     
     supported = []
     unsupported = []
     
-    # Separate objectives into supported and unsupported lists
+    # Separate into supported and unsupported lists in one pass
     for o in objectives:
         if o.get('supported'):
             supported.append(o)
@@ -40,11 +131,24 @@ def get_objectives(config, objective_ids=None):
 
 def get_app_config(config, app_name):
     """Get configuration for a specific app"""
-    apps = config.get('apps', [])
-    for app in apps:
-        if app.get('name') == app_name:
-            return app
-    raise ValueError(f"App '{app_name}' not found in config")
+    try:
+        return _index_by(config, 'apps', 'name')[app_name]
+    except KeyError:
+        raise ValueError(f"App '{app_name}' not found in config") from None
+
+
+def get_objective_app(instructions, objective_id):
+    """Get the app name for an objective id, or None if there's no such objective"""
+    objective = _index_by(instructions, 'objectives', 'id', last_wins=True).get(objective_id)
+    return objective.get('app') if objective is not None else None
+
+
+def get_objectives_for_app(instructions, app_name):
+    """Get every objective for an app (case-insensitive), in file order
+    
+    The returned list is shared - copy it before modifying.
+    """
+    return _objectives_by_app(instructions).get(app_name.lower(), [])
 
 
 def get_default_app(config):
@@ -1,114 +1,101 @@
 import sys
-from datetime import datetime
+import logging
 from config import load_config, get_app_config
 from workflow import WorkflowManager
-from workflow.workflow_executor import WORKFLOW_SEQUENCES, execute_workflow_sequence_by_name
-from utils import print_banner
+from app_preparation import ProcessSnapshot
+from workflow.workflow_executor import WORKFLOW_SEQUENCES, WORKFLOW_SEQUENCE_NAMES, execute_workflow_sequence_by_name
+from utils import print_banner, new_session_id
 from cli_utils import parse_objective_args, resolve_app_for_objective
 
 
-def main():
-    """Flexible CLI:
-    - python main.py                     -> prepare default_app only
-    - python main.py <objective_id>      -> auto-detect app & run single objective
-    - python main.py <AppName> <obj...>  -> run one or multiple objectives
-    """
-    config = load_config()
-
-    # No args: prepare default app
-    if len(sys.argv) == 1:
-        app_name = config.get('default_app')
-        if not app_name:
-            print('[ERROR] No default_app in config')
-            return 1
-        try:
-            app_config = get_app_config(config, app_name)
-        except Exception as e:
-            print(f"[ERROR] {e}")
-            return 1
-        wm = WorkflowManager(config)
-        if wm.prepare_application(app_name, app_config):
-            print_banner('PREPARATION COMPLETE - App is ready')
-            print(f"\nTo execute objectives, use: python main.py {app_name} <objective_ids>")
-            return 0
-        print('[FAIL] Application preparation failed')
-        return 2
-
-    # One token: either objective id, sequence name, or app name
-    if len(sys.argv) == 2:
-        token = sys.argv[1].strip()
-        
-        # Check if it's a workflow sequence
-        if token in WORKFLOW_SEQUENCES:
-            print(f"[INFO] Detected workflow sequence: {token}")
-            print(f"Sequence: {' -> '.join(WORKFLOW_SEQUENCES[token])}")
-            
-            # Determine app from sequence (assume Spotify for now)
-
-            app_name = "Spotify"
-            try:
-                app_config = get_app_config(config, app_name)
-                
-            except Exception as e:
-                print(f"[ERROR] {e}")
-                return 1
-            
-            # Execute the sequence
-            session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-            # Pass the full top-level config (not the app-specific config)
-            ok = execute_workflow_sequence_by_name(token, config, session_id)
-            return 0 if ok else 3
-        
-        # Try to resolve as objective
-        app_name = resolve_app_for_objective(config, token)
-        wm = WorkflowManager(config)
-        if app_name:
-            try:
-                app_config = get_app_config(config, app_name)
-            except Exception as e:
-                print(f"[ERROR] {e}")
-                return 1
-            print(f"[INFO] Resolved objective '{token}' to app '{app_name}'")
-            ok = wm.execute_single_objective(app_name, app_config, token)
-            return 0 if ok else 3
-        else:
-            # token is app name -> prepare only
-            app_name = token
-            try:
-                app_config = get_app_config(config, app_name)
-            except Exception as e:
-                print(f"[ERROR] {e}")
-                return 1
-            if wm.prepare_application(app_name, app_config):
-                print_banner('PREPARATION COMPLETE - App is ready')
-                return 0
-            print('[FAIL] Application preparation failed')
-            return 2
-
-    # Multiple args: first is app name, rest are objectives
-    app_name = sys.argv[1].strip()
-    objective_ids = parse_objective_args(sys.argv[2:])
+def _get_app_config_or_report(config, app_name):
+    """Look up an app's config, printing the error and returning None if it's missing"""
     try:
-        app_config = get_app_config(config, app_name)
+        return get_app_config(config, app_name)
     except Exception as e:
         print(f"[ERROR] {e}")
+        return None
+
+
+def _prepare_only(wm, app_name, app_config, hint=None):
+    """Prepare an app without running objectives and return the exit code"""
+    if wm.prepare_application(app_name, app_config):
+        print_banner('PREPARATION COMPLETE - App is ready')
+        if hint:
+            print(hint)
+        return 0
+    print('[FAIL] Application preparation failed')
+    return 2
+
+
+def _run_sequence(name, config, process_snapshot):
+    """Run a predefined workflow sequence and return the exit code"""
+    # Pass the full top-level config (not the app-specific config)
+    ok = execute_workflow_sequence_by_name(name, config, new_session_id(), process_snapshot)
+    return 0 if ok else 3
+
+
+def _run_default_app(config, args, process_snapshot):
+    """No args: prepare default app"""
+    app_name = config.get('default_app')
+    if not app_name:
+        print('[ERROR] No default_app in config')
+        return 1
+    app_config = _get_app_config_or_report(config, app_name)
+    if app_config is None:
+        return 1
+    wm = WorkflowManager(config, process_snapshot)
+    return _prepare_only(wm, app_name, app_config,
+                         f"\nTo execute objectives, use: python main.py {app_name} <objective_ids>")
+
+
+def _run_single_token(config, args, process_snapshot):
+    """One token: either objective id, sequence name, or app name"""
+    token = args[0].strip()
+
+    # Check if it's a workflow sequence
+    if token in WORKFLOW_SEQUENCE_NAMES:
+        print(f"[INFO] Detected workflow sequence: {token}")
+        print(f"Sequence: {' -> '.join(WORKFLOW_SEQUENCES[token])}")
+
+        # Determine app from sequence (assume Spotify for now)
+        if _get_app_config_or_report(config, "Spotify") is None:
+            return 1
+        return _run_sequence(token, config, process_snapshot)
+
+    # Try to resolve as objective
+    objective_app = resolve_app_for_objective(config, token)
+    # Resolved objective -> its app; otherwise the token is an app name -> prepare only
+    app_name = objective_app or token
+    app_config = _get_app_config_or_report(config, app_name)
+    if app_config is None:
+        return 1
+
+    wm = WorkflowManager(config, process_snapshot)
+    if not objective_app:
+        return _prepare_only(wm, app_name, app_config)
+    print(f"[INFO] Resolved objective '{token}' to app '{app_name}'")
+    ok = wm.execute_single_objective(app_name, app_config, token)
+    return 0 if ok else 3
+
+
+def _run_app_objectives(config, args, process_snapshot):
+    """Multiple args: first is app name, rest are objectives"""
+    app_name = args[0].strip()
+    objective_ids = parse_objective_args(args[1:])
+    app_config = _get_app_config_or_report(config, app_name)
+    if app_config is None:
         return 1
 
-    wm = WorkflowManager(config)
+    wm = WorkflowManager(config, process_snapshot)
     if not objective_ids:
-        if wm.prepare_application(app_name, app_config):
-            print_banner('PREPARATION COMPLETE - App is ready')
-            return 0
-        print('[FAIL] Application preparation failed')
-        return 2
+        return _prepare_only(wm, app_name, app_config)
 
     if len(objective_ids) == 1:
         # If the single objective token is actually a predefined workflow sequence,
         # execute the named sequence instead of treating it as an objective id.
-        if objective_ids[0] in WORKFLOW_SEQUENCES:
-            session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-            ok = execute_workflow_sequence_by_name(objective_ids[0], config, session_id)
-            return 0 if ok else 3
+        if objective_ids[0] in WORKFLOW_SEQUENCE_NAMES:
+            return _run_sequence(objective_ids[0], config, process_snapshot)
 
         ok = wm.execute_single_objective(app_name, app_config, objective_ids[0])
         return 0 if ok else 3
@@ -117,5 +104,29 @@ def main():
     return 0 if ok else 4
 
 
+# CLI mode by number of arguments; anything longer is <AppName> <obj...>
+_COMMANDS_BY_ARGC = {
+    0: _run_default_app,
+    1: _run_single_token,
+}
+
+
+def main():
+    """Flexible CLI:
+    - python main.py                     -> prepare default_app only
+    - python main.py <objective_id>      -> auto-detect app & run single objective
+    - python main.py <AppName> <obj...>  -> run one or multiple objectives
+    """
+    # Plain messages on stdout so logged lines interleave with the printed ones
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    config = load_config()
+    args = sys.argv[1:]
+    # One process scan up front, shared by every "is the app already running?" check
+    process_snapshot = ProcessSnapshot()
+
+    command = _COMMANDS_BY_ARGC.get(len(args), _run_app_objectives)
+    return command(config, args, process_snapshot)
+
+
 if __name__ == "__main__":
-    raise SystemExit(main())
\ No newline at end of file
+    raise SystemExit(main())
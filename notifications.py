@@ -1,5 +1,8 @@
 import os
+import atexit
 import smtplib
+import threading
+import time
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from datetime import datetime
@@ -8,10 +11,61 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+# Environment doesn't change mid-run, so read the email settings once
+_FROM_EMAIL = os.getenv('FROM_EMAIL')
+_SMTP_SERVER = os.getenv('SMTP_SERVER')
+_SMTP_PORT = os.getenv('SMTP_PORT', 587)
+_SMTP_USERNAME = os.getenv('SMTP_USERNAME')
+_SMTP_PASSWORD = os.getenv('SMTP_PASSWORD')
+_TO_EMAIL = os.getenv('TO_EMAIL')
+_EMAIL_CONFIGURED = all((_FROM_EMAIL, _SMTP_SERVER, _SMTP_USERNAME, _SMTP_PASSWORD, _TO_EMAIL))
+
+# One logged-in SMTP session reused by every notification, opened on first send
+_smtp = None
+_smtp_lock = threading.Lock()
+_smtp_last_used = 0.0
+
+# Servers commonly drop sessions idle for a minute or more; past this, NOOP-check
+# the session before reusing it rather than failing the send and retrying
+_SMTP_IDLE_CHECK = 60.0
+
+
+def _close_smtp():
+    """Close the shared SMTP session (registered with atexit)"""
+    global _smtp
+    if _smtp is not None:
+        try:
+            _smtp.quit()
+        except Exception:
+            pass
+        _smtp = None
+
+
+def _get_smtp():
+    """Get the shared SMTP session, connecting and logging in if needed"""
+    global _smtp, _smtp_last_used
+    now = time.monotonic()
+    if _smtp is not None and now - _smtp_last_used > _SMTP_IDLE_CHECK:
+        try:
+            if _smtp.noop()[0] != 250:
+                _close_smtp()
+        except (smtplib.SMTPException, OSError):
+            _close_smtp()
+    _smtp_last_used = now
+    if _smtp is None:
+        server = smtplib.SMTP(_SMTP_SERVER, int(_SMTP_PORT))
+        server.starttls()
+        server.login(_SMTP_USERNAME, _SMTP_PASSWORD)
+        _smtp = server
+    return _smtp
+
+
+atexit.register(_close_smtp)
+
+
 def is_email_configured():
     """Check if email configuration is available"""
-    required_vars = ['FROM_EMAIL', 'SMTP_SERVER', 'SMTP_USERNAME', 'SMTP_PASSWORD', 'TO_EMAIL']
-    return all(os.getenv(var) for var in required_vars)
+    return _EMAIL_CONFIGURED
 
 
 def send_email(to_email, subject, body):
@@ -26,22 +80,19 @@ def send_email(to_email, subject, body):
         return
     
     try:
-        from_email = os.getenv('FROM_EMAIL')
-        smtp_server = os.getenv('SMTP_SERVER')
-        smtp_port = int(os.getenv('SMTP_PORT', 587))
-        username = os.getenv('SMTP_USERNAME')
-        password = os.getenv('SMTP_PASSWORD')
-        
         msg = MIMEMultipart()
-        msg['From'] = from_email
+        msg['From'] = _FROM_EMAIL
         msg['To'] = to_email
         msg['Subject'] = subject
         msg.attach(MIMEText(body, 'plain'))
         
-        with smtplib.SMTP(smtp_server, smtp_port) as server:
-            server.starttls()
-            server.login(username, password)
-            server.send_message(msg)
+        with _smtp_lock:
+            try:
+                _get_smtp().send_message(msg)
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                # Server dropped the idle session - reconnect once and resend
+                _close_smtp()
+                _get_smtp().send_message(msg)
         
         print(f"Email sent successfully to {to_email}")
     except Exception as e:
@@ -61,20 +112,15 @@ Error: {error_msg}
 Timestamp: {datetime.now()}
     """
     
-    to_email = os.getenv('TO_EMAIL')
-    send_email(to_email, subject, body)
+    send_email(_TO_EMAIL, subject, body)
 
 
 def notify_unsupported(unsupported_objectives):
     """Notify about unsupported objectives"""
     subject = "Unsupported Automation Objectives"
-    body = "The following objectives are not supported:\n\n"
-    
-    for obj in unsupported_objectives:
-        name = obj['name']
-        reason = obj.get('reason', 'Unknown')
-        body += "- " + name + ": " + reason + "\n"
+    body = "The following objectives are not supported:\n\n" + "".join(
+        f"- {obj['name']}: {obj.get('reason', 'Unknown')}\n" for obj in unsupported_objectives
+    )
     
-    to_email = os.getenv('TO_EMAIL')
-    send_email(to_email, subject, body)
+    send_email(_TO_EMAIL, subject, body)
 
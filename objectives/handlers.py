@@ -4,11 +4,31 @@ This module provides four simple handlers that delegate to the core
 executor where appropriate. The previous-track handler includes a layered
 strategy (template -> approximate click -> configured actions -> final
 media-key fallback) and saves diagnostic screenshots when fallbacks are
-used.
+used and settings.debug_screenshots is enabled.
 """
 
 import time
 
+try:
+    import pyautogui
+    import ui_detection
+    from window_ops import find_window, focus_window
+    from actions import execute_action
+except ImportError:
+    # UI stack not installed (e.g. headless) - UI-driven handlers report it and bail out.
+    # Anything else (a broken module of ours) should fail loudly at import.
+    pyautogui = ui_detection = find_window = focus_window = execute_action = None
+
+# workflow.workflow_executor imports this module (through objectives.mapping),
+# so its executor is looked up on first use rather than at import time
+_executor = None
+
+
+def _debug_screenshot(config, path):
+    """Save a diagnostic screenshot, only when settings.debug_screenshots is on."""
+    if (config or {}).get('settings', {}).get('debug_screenshots'):
+        ui_detection.take_screenshot(path)
+
 
 def _run_configured_actions(objective, config, session_id):
     """Run the objective's configured action list via the core executor.
@@ -16,9 +36,12 @@ def _run_configured_actions(objective, config, session_id):
     Uses execute_single_objective_no_dispatch to avoid re-dispatching back
     into handlers (prevents recursion).
     """
+    global _executor
     try:
-        from workflow.workflow_executor import execute_single_objective_no_dispatch
-        return execute_single_objective_no_dispatch(objective, config, session_id)
+        if _executor is None:
+            from workflow.workflow_executor import execute_single_objective_no_dispatch
+            _executor = execute_single_objective_no_dispatch
+        return _executor(objective, config, session_id)
     except Exception as e:
         print(f"  [ERROR] Unable to run configured actions: {e}")
         return False
@@ -41,11 +64,7 @@ def spotify_previous_track(objective, config, session_id=None):
 
     Returns True on success, False otherwise.
     """
-    try:
-        import ui_detection
-        import pyautogui
-        from window_ops import find_window, focus_window
-    except Exception:
+    if ui_detection is None:
         print("  [ERROR] UI modules unavailable for spotify_previous_track")
         return False
 
@@ -73,14 +92,14 @@ def spotify_previous_track(objective, config, session_id=None):
             left, top, w, h = win.left, win.top, win.width, win.height
             x = int(left + w / 2 - 45)
             y = int(top + h - 70)
-            ui_detection.take_screenshot('screenshots/prev_click_before.png')
+            _debug_screenshot(config, 'screenshots/prev_click_before.png')
             pyautogui.click(x, y)
             time.sleep(0.18)
-            ui_detection.take_screenshot('screenshots/prev_click_after.png')
             after_win = find_window(app_name)
             after_title = after_win.title if after_win else None
             if before_title and after_title and before_title != after_title:
                 return True
+            _debug_screenshot(config, 'screenshots/prev_click_after.png')
     except Exception as e:
         print(f"  [WARN] Approximate UI click failed: {e}")
 
@@ -95,20 +114,19 @@ def spotify_previous_track(objective, config, session_id=None):
 
     # 4) Final fallback: send extra media 'previous_track' (twice) and save debug screenshots
     try:
-        from actions import execute_action
-        ui_detection.take_screenshot('screenshots/prev_debug_before.png')
+        _debug_screenshot(config, 'screenshots/prev_debug_before.png')
         # Some players restart the current song on first 'previous' press — send it twice
         print("  [INFO] Final fallback: sending 'previous_track' hotkey twice")
         execute_action({'type': 'hotkey', 'keys': ['previous_track']})
         time.sleep(0.12)
         execute_action({'type': 'hotkey', 'keys': ['previous_track']})
         time.sleep(0.25)
-        ui_detection.take_screenshot('screenshots/prev_debug_after.png')
         final_win = find_window(app_name)
         final_title = final_win.title if final_win else None
         if before_title and final_title and before_title != final_title:
             return True
-        print("  [WARN] previous did not appear to change; saved debug screenshots")
+        _debug_screenshot(config, 'screenshots/prev_debug_after.png')
+        print("  [WARN] previous did not appear to change")
         return False
     except Exception as e:
         print(f"  [ERROR] Final fallback failed: {e}")
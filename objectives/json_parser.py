@@ -4,6 +4,7 @@ Handles reading JSON file and creating actions
 """
 
 import json
+from config import load_instructions
 
 
 def parse_json_objectives(config):
@@ -22,8 +23,7 @@ def parse_json_objectives(config):
     instructions_path = config.get('instructions_file', 'config/instructions.json')
     
     try:
-        with open(instructions_path, 'r') as f:
-            instructions = json.load(f)
+        instructions = load_instructions(config)
         
         objectives = instructions.get('objectives', [])
         print(f"[OK] Loaded {len(objectives)} objectives from {instructions_path}")
@@ -2,16 +2,21 @@
 Mapping between JSON objective IDs and their handler functions.
 Import this mapping to resolve a JSON objective to code to run.
 """
+from types import MappingProxyType
 from . import handlers
 
 
-OBJECTIVE_HANDLERS = {
+# Read-only so the registry can't drift after import
+OBJECTIVE_HANDLERS = MappingProxyType({
     'spotify_play': handlers.spotify_play,
     'spotify_pause': handlers.spotify_pause,
     'spotify_next_track': handlers.spotify_next_track,
     'spotify_previous_track': handlers.spotify_previous_track,
     # Add more mappings as handlers are implemented
-}
+})
+
+# Bound lookup for hot dispatch paths: dispatch(objective_id) -> handler or None
+dispatch = OBJECTIVE_HANDLERS.get
 
 
 def get_handler_for_objective_id(objective_id):
@@ -3,6 +3,58 @@ Objective Filter Module
 Handles finding supported/unsupported objectives
 """
 
+import logging
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+
+# Minimal objective shape: id, name, and a list of actions that each have a type
+OBJECTIVE_SCHEMA = {
+    'type': 'object',
+    'required': ['id', 'name', 'actions'],
+    'properties': {
+        'actions': {
+            'type': 'array',
+            'items': {'type': 'object', 'required': ['type']},
+        },
+    },
+}
+
+REQUIRED_OBJECTIVE_FIELDS = frozenset(OBJECTIVE_SCHEMA['required'])
+
+# Generated validator when fastjsonschema is installed; the hand-written checks
+# below still run on failure to report which field is wrong
+_validate_objective = fastjsonschema.compile(OBJECTIVE_SCHEMA) if fastjsonschema else None
+
+# Progress lines are INFO (shown by main.py, silent unless logging is configured);
+# structure problems are WARNING
+logger = logging.getLogger(__name__)
+
+# last_wins -> (list, id -> objective) for the most recently indexed list. Objective
+# lists come from the shared instructions cache, so the same list object is passed
+# on every call.
+_objective_index = {}
+
+
+def _index_objectives(objectives, last_wins=False):
+    """Get an id -> objective dict for a list, rebuilt only when a different list is passed
+    
+    For a repeated id the first definition is kept, or the last with last_wins.
+    """
+    indexed, by_id = _objective_index.get(last_wins, (None, None))
+    if indexed is not objectives:
+        if last_wins:
+            by_id = {obj.get('id'): obj for obj in objectives}
+        else:
+            by_id = {}
+            for obj in objectives:
+                by_id.setdefault(obj.get('id'), obj)
+        _objective_index[last_wins] = (objectives, by_id)
+    return by_id
+
 
 def filter_supported_objectives(objectives, objective_ids=None):
     """
@@ -15,33 +67,35 @@ def filter_supported_objectives(objectives, objective_ids=None):
     Returns:
         tuple: (supported_objectives, unsupported_objectives)
     """
-    print("Filtering supported and unsupported objectives...")
-    
-    # Filter by objective IDs if provided, preserving order
-    if objective_ids:
-        filtered_objectives = []
-        # Create a lookup dictionary for faster searching
-        objective_lookup = {obj.get('id'): obj for obj in objectives}
-        
-        # Process objectives in the order specified by objective_ids
-        for objective_id in objective_ids:
-            if objective_id in objective_lookup:
-                filtered_objectives.append(objective_lookup[objective_id])
-        objectives = filtered_objectives
-        print(f"Filtered to {len(objectives)} objectives by IDs")
+    logger.info("Filtering supported and unsupported objectives...")
     
     supported = []
     unsupported = []
     
-    # Separate objectives into supported and unsupported lists
-    for objective in objectives:
-        if objective.get('supported', False):
-            supported.append(objective)
-        else:
-            unsupported.append(objective)
+    if objective_ids:
+        # Process objectives in the order specified by objective_ids, looking each
+        # up and sorting it into supported/unsupported in the same pass
+        # A repeated id resolves to its later definition
+        objective_lookup = _index_objectives(objectives, last_wins=True)
+        for objective_id in objective_ids:
+            objective = objective_lookup.get(objective_id)
+            if objective is None:
+                continue
+            if objective.get('supported', False):
+                supported.append(objective)
+            else:
+                unsupported.append(objective)
+        logger.info("Filtered to %d objectives by IDs", len(supported) + len(unsupported))
+    else:
+        # Separate objectives into supported and unsupported lists
+        for objective in objectives:
+            if objective.get('supported', False):
+                supported.append(objective)
+            else:
+                unsupported.append(objective)
     
-    print(f"[OK] Found {len(supported)} supported objectives")
-    print(f"[OK] Found {len(unsupported)} unsupported objectives")
+    logger.info("[OK] Found %d supported objectives", len(supported))
+    logger.info("[OK] Found %d unsupported objectives", len(unsupported))
     
     return supported, unsupported
 
@@ -57,10 +111,7 @@ def get_objective_by_id(objectives, objective_id):
     Returns:
         dict or None: The objective if found, None otherwise
     """
-    for objective in objectives:
-        if objective.get('id') == objective_id:
-            return objective
-    return None
+    return _index_objectives(objectives).get(objective_id)
 
 
 def validate_objective_structure(objective):
@@ -73,26 +124,35 @@ def validate_objective_structure(objective):
     Returns:
         bool: True if valid, False otherwise
     """
-    required_fields = ['id', 'name', 'actions']
+    if _validate_objective is not None:
+        try:
+            _validate_objective(objective)
+            return True
+        except fastjsonschema.JsonSchemaException:
+            pass
     
-    for field in required_fields:
-        if field not in objective:
-            print(f"[WARN] Objective missing required field: {field}")
-            return False
+    if not isinstance(objective, dict):
+        logger.warning("[WARN] Objective must be a dictionary, got %s", type(objective).__name__)
+        return False
+    
+    missing = REQUIRED_OBJECTIVE_FIELDS - objective.keys()
+    if missing:
+        logger.warning("[WARN] Objective missing required field(s): %s", ', '.join(sorted(missing)))
+        return False
     
     # Validate actions structure
     actions = objective.get('actions', [])
     if not isinstance(actions, list):
-        print(f"[WARN] Objective actions must be a list")
+        logger.warning("[WARN] Objective actions must be a list")
         return False
     
     for i, action in enumerate(actions):
         if not isinstance(action, dict):
-            print(f"[WARN] Action {i} must be a dictionary")
+            logger.warning("[WARN] Action %d must be a dictionary", i)
             return False
         
         if 'type' not in action:
-            print(f"[WARN] Action {i} missing required field: type")
+            logger.warning("[WARN] Action %d missing required field: type", i)
             return False
     
     return True
@@ -3,8 +3,18 @@ Objective Notifier Module
 Handles emailing user with unsupported objectives
 """
 
+import logging
 from notifications import notify_unsupported
 
+logger = logging.getLogger(__name__)
+
+# One numbered entry of create_unsupported_summary
+_SUMMARY_ENTRY = (
+    "{i}. {name} (ID: {id})\n"
+    "   App: {app}\n"
+    "   Reason: Not supported in current system\n\n"
+)
+
 
 def notify_unsupported_objectives(unsupported_objectives):
     """
@@ -17,10 +27,10 @@ def notify_unsupported_objectives(unsupported_objectives):
         bool: True if notification sent successfully, False otherwise
     """
     if not unsupported_objectives:
-        print("[OK] No unsupported objectives to notify about")
+        logger.info("[OK] No unsupported objectives to notify about")
         return True
     
-    print(f"Notifying user about {len(unsupported_objectives)} unsupported objectives...")
+    logger.info("Notifying user about %d unsupported objectives...", len(unsupported_objectives))
     
     # Extract objective details for notification
     unsupported_details = []
@@ -36,10 +46,10 @@ def notify_unsupported_objectives(unsupported_objectives):
     # Send notification
     try:
         notify_unsupported(unsupported_details)
-        print("[OK] Notification sent successfully")
+        logger.info("[OK] Notification sent successfully")
         return True
     except Exception as e:
-        print(f"[ERROR] Failed to send notification: {str(e)}")
+        logger.error("[ERROR] Failed to send notification: %s", e)
         return False
 
 
@@ -56,11 +66,14 @@ def create_unsupported_summary(unsupported_objectives):
     if not unsupported_objectives:
         return "No unsupported objectives found."
     
-    summary = f"Found {len(unsupported_objectives)} unsupported objectives:\n\n"
-    
-    for i, objective in enumerate(unsupported_objectives, 1):
-        summary += f"{i}. {objective.get('name', 'Unknown')} (ID: {objective.get('id', 'Unknown')})\n"
-        summary += f"   App: {objective.get('app', 'Unknown')}\n"
-        summary += f"   Reason: Not supported in current system\n\n"
-    
-    return summary
+    lines = [f"Found {len(unsupported_objectives)} unsupported objectives:\n\n"]
+    lines.extend(
+        _SUMMARY_ENTRY.format_map({
+            'i': i,
+            'name': objective.get('name', 'Unknown'),
+            'id': objective.get('id', 'Unknown'),
+            'app': objective.get('app', 'Unknown'),
+        })
+        for i, objective in enumerate(unsupported_objectives, 1)
+    )
+    return "".join(lines)
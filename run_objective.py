@@ -1,6 +1,7 @@
 import sys
 import os
 import json
+import logging
 
 # Ensure project root on sys.path
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
@@ -9,24 +10,33 @@ if PROJECT_ROOT not in sys.path:
 
 from config import load_config, load_instructions, get_app_config
 from workflow import WorkflowManager
+from objectives.objective_filter import get_objective_by_id
 
 
 def run_objective_cli(argv=None):
     """Run a single objective from the instructions file.
 
-    argv: optional list of arguments (defaults to sys.argv)
+    argv: optional list of arguments (defaults to sys.argv); pass --verbose
+    to show the INFO-level progress lines from the objective modules
     Returns an exit code integer.
     """
     if argv is None:
         argv = sys.argv
 
+    if '--verbose' in argv:
+        argv = [arg for arg in argv if arg != '--verbose']
+        logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+
     if len(argv) < 2:
         # No CLI argument allowed for actions per user request.
         # Prompt the user to type the objective id exactly as listed in config/instructions.json
-        try:
-            objective_id = input("Enter objective id (as in config/instructions.json): ").strip()
-        except Exception:
-            objective_id = None
+        # (only when someone is there to answer - piped/CI stdin goes straight to the usage hint)
+        objective_id = None
+        if sys.stdin is not None and sys.stdin.isatty():
+            try:
+                objective_id = input("Enter objective id (as in config/instructions.json): ").strip()
+            except EOFError:
+                objective_id = None
 
         if not objective_id:
             print("No objective id provided.")
@@ -39,11 +49,7 @@ def run_objective_cli(argv=None):
     objectives = instructions.get('objectives', [])
 
     # Find objective
-    objective = None
-    for o in objectives:
-        if o.get('id') == objective_id:
-            objective = o
-            break
+    objective = get_objective_by_id(objectives, objective_id)
 
     if not objective:
         print(f"Objective '{objective_id}' not found in instructions.json")
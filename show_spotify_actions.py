@@ -4,8 +4,8 @@ Show supported and unsupported Spotify actions
 """
 
 import json
-from config import load_config
-from objectives.json_parser import parse_json_objectives
+from collections import Counter
+from config import load_config, load_instructions, get_objectives_for_app
 from objectives.objective_filter import filter_supported_objectives
 
 def show_spotify_actions():
@@ -14,27 +14,23 @@ def show_spotify_actions():
     print("SPOTIFY AUTOMATION ACTIONS")
     print("=" * 50)
     
-    # Load config and parse objectives
+    # Load config, then read the objectives and the mock unsupported objectives
+    # from the same parsed instructions
     config = load_config()
-    all_objectives = parse_json_objectives(config)
-    
-    # Also load mock unsupported objectives directly from JSON
-    import json
-    instructions_path = config.get('instructions_file', 'config/instructions.json')
     try:
-        with open(instructions_path, 'r') as f:
-            instructions = json.load(f)
-        mock_unsupported = instructions.get('mock_unsupported_objectives', [])
+        instructions = load_instructions(config)
     except Exception as e:
-        print(f"ERROR loading mock objectives: {e}")
-        mock_unsupported = []
+        print(f"ERROR loading instructions: {e}")
+        instructions = {}
+    all_objectives = instructions.get('objectives', [])
+    mock_unsupported = instructions.get('mock_unsupported_objectives', [])
     
     if not all_objectives:
         print("ERROR: No objectives found in JSON file")
         return
     
     # Filter for Spotify objectives
-    spotify_objectives = [obj for obj in all_objectives if obj.get('app', '').lower() == 'spotify']
+    spotify_objectives = get_objectives_for_app(instructions, 'spotify')
     
     if not spotify_objectives:
         print("ERROR: No Spotify objectives found")
@@ -52,12 +48,14 @@ def show_spotify_actions():
     # Show supported actions
     print("SUPPORTED ACTIONS:")
     print("-" * 30)
+    # Everything in `supported` passed the supported check in filter_supported_objectives
     for obj in supported:
-        status = "[OK]" if obj.get('supported', False) else "[FAIL]"
-        print(f"{status} {obj.get('id', 'unknown')}")
-        print(f"   Name: {obj.get('name', 'No name')}")
-        if obj.get('reason'):
-            print(f"   Note: {obj.get('reason')}")
+        get = obj.get
+        reason = get('reason')
+        print(f"[OK] {get('id', 'unknown')}")
+        print(f"   Name: {get('name', 'No name')}")
+        if reason:
+            print(f"   Note: {reason}")
         print()
     
     # Show unsupported actions
@@ -65,22 +63,23 @@ def show_spotify_actions():
         print("UNSUPPORTED ACTIONS:")
         print("-" * 30)
         for obj in unsupported:
-            print(f"[FAIL] {obj.get('id', 'unknown')}")
-            print(f"   Name: {obj.get('name', 'No name')}")
-            if obj.get('reason'):
-                print(f"   Reason: {obj.get('reason')}")
+            get = obj.get
+            reason = get('reason')
+            print(f"[FAIL] {get('id', 'unknown')}")
+            print(f"   Name: {get('name', 'No name')}")
+            if reason:
+                print(f"   Reason: {reason}")
             print()
     
     # Show action types breakdown
     print("ACTION TYPES BREAKDOWN:")
     print("-" * 30)
     
-    action_types = {}
-    for obj in spotify_objectives:
-        actions = obj.get('actions', [])
-        for action in actions:
-            action_type = action.get('type', 'unknown')
-            action_types[action_type] = action_types.get(action_type, 0) + 1
+    action_types = Counter(
+        action.get('type', 'unknown')
+        for obj in spotify_objectives
+        for action in obj.get('actions', [])
+    )
     
     for action_type, count in sorted(action_types.items()):
         print(f"   {action_type}: {count} actions")
@@ -89,8 +88,7 @@ def show_spotify_actions():
     print("QUICK COMMANDS:")
     print("-" * 30)
     for obj in supported:
-        if obj.get('supported', False):
-            print(f"python main.py Spotify {obj.get('id')}")
+        print(f"python main.py Spotify {obj.get('id')}")
 
 if __name__ == "__main__":
     show_spotify_actions()
@@ -1,31 +1,167 @@
 import os
 import json
+import time
+import queue
+import atexit
+import threading
+from collections import deque
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Checkpoints are written by one background thread so the workflow loop
+# doesn't wait on disk; writes for a session still land in order
+_checkpoint_queue = queue.Queue()
+_checkpoint_worker = None
+_checkpoint_worker_lock = threading.Lock()
+
+
+# Set once checkpoints/ has been created, so later writes skip the makedirs call
+_checkpoint_dir_ready = False
+
+# Open append handles for checkpoints/<session_id>.jsonl - only the writer thread touches these
+_history_files = {}
+
+
+def _dump_json(data, indent=True):
+    """Serialize to JSON bytes (orjson if installed), indented unless indent=False"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2) if indent else orjson.dumps(data)
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+
+def _load_json(data):
+    """Parse JSON bytes (orjson if installed)"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _ensure_checkpoint_dir():
+    """Create checkpoints/ on first use"""
+    global _checkpoint_dir_ready
+    if not _checkpoint_dir_ready:
+        os.makedirs('checkpoints', exist_ok=True)
+        _checkpoint_dir_ready = True
+
+
+def _write_checkpoint(checkpoint):
+    """Write a checkpoint dict to checkpoints/<session_id>.json"""
+    _ensure_checkpoint_dir()
+    with open(f"checkpoints/{checkpoint['session_id']}.json", 'wb') as f:
+        f.write(_dump_json(checkpoint))
+
+
+def _append_history_line(session_id, event):
+    """Append one history event as a line of checkpoints/<session_id>.jsonl"""
+    f = _history_files.get(session_id)
+    if f is None:
+        _ensure_checkpoint_dir()
+        f = open(f'checkpoints/{session_id}.jsonl', 'ab')
+        _history_files[session_id] = f
+    f.write(_dump_json(event, indent=False) + b'\n')
+    f.flush()
+
+
+def _checkpoint_writer():
+    """Background loop draining the checkpoint queue"""
+    while True:
+        write, args = _checkpoint_queue.get()
+        try:
+            write(*args)
+        except Exception as e:
+            print(f"[WARN] Failed to save checkpoint: {e}")
+        finally:
+            _checkpoint_queue.task_done()
+
+
+def _close_history_files():
+    """Flush pending writes and close the history logs (registered with atexit)"""
+    flush_checkpoints()
+    for f in _history_files.values():
+        f.close()
+    _history_files.clear()
+
+
+def _ensure_checkpoint_worker():
+    """Start the writer thread on first use"""
+    global _checkpoint_worker
+    if _checkpoint_worker is None:
+        with _checkpoint_worker_lock:
+            if _checkpoint_worker is None:
+                worker = threading.Thread(target=_checkpoint_writer, name='checkpoint-writer', daemon=True)
+                worker.start()
+                atexit.register(_close_history_files)
+                _checkpoint_worker = worker
+
+
+def format_timestamp(timestamp_ns):
+    """Turn a stored time.time_ns() value into a local ISO-8601 string"""
+    return datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+
+
+def flush_checkpoints():
+    """Block until every queued checkpoint has been written"""
+    _checkpoint_queue.join()
+
+
+def append_history_event(session_id, objective_id, action_index, action):
+    """Queue one completed action to be appended to the session's history log"""
+    event = {
+        'objective_id': objective_id,
+        'action_index': action_index,
+        'action': action,
+        'timestamp_ns': time.time_ns()
+    }
+    
+    _ensure_checkpoint_worker()
+    _checkpoint_queue.put((_append_history_line, (session_id, event)))
+
 
 def save_checkpoint(session_id, objective_id, action_index, history):
-    """Save checkpoint to file"""
+    """Queue a checkpoint to be saved to file
+    
+    Only the number of completed actions is stored - the actions themselves
+    go to the history log through append_history_event, one line each.
+    """
     checkpoint = {
         'session_id': session_id,
         'objective_id': objective_id,
         'action_index': action_index,
-        'history': history,
-        'timestamp': datetime.now().isoformat()
+        'history_length': len(history),
+        'timestamp_ns': time.time_ns()
     }
     
-    os.makedirs('checkpoints', exist_ok=True)
-    with open(f'checkpoints/{session_id}.json', 'w') as f:
-        json.dump(checkpoint, f, indent=2)
+    _ensure_checkpoint_worker()
+    _checkpoint_queue.put((_write_checkpoint, (checkpoint,)))
 
 
 def load_checkpoint(session_id):
-    """Load checkpoint from file"""
+    """Load checkpoint from file, rebuilding its history from the history log"""
+    flush_checkpoints()
     path = f'checkpoints/{session_id}.json'
     if not os.path.exists(path):
         return None
     
-    with open(path, 'r') as f:
-        return json.load(f)
+    with open(path, 'rb') as f:
+        checkpoint = _load_json(f.read())
+    if 'timestamp_ns' in checkpoint:
+        checkpoint['timestamp'] = format_timestamp(checkpoint.pop('timestamp_ns'))
+    
+    # The checkpoint's history is the last history_length events logged
+    history_length = checkpoint.pop('history_length', None)
+    if history_length is not None:
+        history = deque(maxlen=history_length) if history_length else []
+        history_path = f'checkpoints/{session_id}.jsonl'
+        if history_length and os.path.exists(history_path):
+            with open(history_path, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        history.append(_load_json(line)['action'])
+        checkpoint['history'] = list(history)
+    return checkpoint
 
 
 def append_to_history(history, action, status):
@@ -33,7 +169,7 @@ def append_to_history(history, action, status):
     history.append({
         'action': action,
         'status': status,
-        'timestamp': datetime.now().isoformat()
+        'timestamp_ns': time.time_ns()
     })
     return history
 
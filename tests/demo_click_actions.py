@@ -6,9 +6,11 @@ Demonstrates click action functionality without user interaction
 
 import time
 import os
+import cv2
 import pyautogui
-from actions import execute_action, ACTION_HANDLERS
+from actions import execute_action, CLICK_HANDLERS
 import ui_detection
+import capture
 import verification
 
 
@@ -20,8 +22,7 @@ def demo_click_actions():
     # 1. Show available action handlers
     print("\n1. Available Click Action Handlers:")
     print("-" * 40)
-    click_handlers = [name for name in ACTION_HANDLERS.keys() if 'click' in name or name == 'close_window']
-    for handler in click_handlers:
+    for handler in CLICK_HANDLERS:
         print(f"   - {handler}")
     
     # 2. Test screenshot functionality
@@ -48,26 +49,30 @@ def demo_click_actions():
     # 4. Test coordinate clicking (safe location)
     print("\n4. Testing Coordinate Clicking:")
     print("-" * 40)
+    # Before/after frames are only written to disk if the click fails
+    frames = {}
     try:
         # Get screen center
-        screen_width, screen_height = pyautogui.size()
+        screen_width, screen_height = ui_detection.get_screen_size()
         center_x, center_y = screen_width // 2, screen_height // 2
         
         print(f"   [INFO] Screen center: ({center_x}, {center_y})")
         
-        # Take screenshot before
-        ui_detection.take_screenshot("before_click_demo.png")
+        # Keep the screen before the click in memory
+        frames["before_click_demo.png"] = capture.grab_bgr()
         
         # Click at center
         pyautogui.click(center_x, center_y)
         time.sleep(0.5)
         
-        # Take screenshot after
-        ui_detection.take_screenshot("after_click_demo.png")
+        # Keep the screen after the click in memory
+        frames["after_click_demo.png"] = capture.grab_bgr()
         
         print("   [SUCCESS] Coordinate click performed")
     except Exception as e:
         print(f"   [ERROR] Coordinate click failed: {e}")
+        for name, frame in frames.items():
+            cv2.imwrite(name, frame)
     
     # 5. Test screen stability
     print("\n5. Testing Screen Stability:")
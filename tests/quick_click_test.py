@@ -6,11 +6,16 @@ Simple tests that can be run immediately
 
 import time
 import os
+import cv2
 import pyautogui
-from actions import execute_action, ACTION_HANDLERS
+from actions import execute_action, ACTION_TYPE_IDS
 import ui_detection
+import capture
 import verification
 
+# Click action types actions.ACTION_TYPE_IDS must dispatch
+EXPECTED_CLICK_HANDLERS = frozenset(('click_image', 'click_text', 'close_window'))
+
 
 def test_basic_click_actions():
     """Test basic click actions without complex setup"""
@@ -21,8 +26,7 @@ def test_basic_click_actions():
     
     # Test 1: Action handlers are registered
     print("1. Testing action handlers registration...")
-    expected_handlers = ['click_image', 'click_text', 'close_window']
-    missing = [h for h in expected_handlers if h not in ACTION_HANDLERS]
+    missing = EXPECTED_CLICK_HANDLERS - ACTION_TYPE_IDS.keys()
     success = len(missing) == 0
     print(f"   {'✅' if success else '❌'} Handlers registered: {success}")
     results.append(("Action Handlers", success))
@@ -51,26 +55,30 @@ def test_basic_click_actions():
     
     # Test 4: Coordinate clicking
     print("4. Testing coordinate clicking...")
+    # Before/after frames are only written to disk if the click fails
+    frames = {}
     try:
         # Get screen center
-        screen_width, screen_height = pyautogui.size()
+        screen_width, screen_height = ui_detection.get_screen_size()
         center_x, center_y = screen_width // 2, screen_height // 2
         
-        # Take screenshot before click
-        ui_detection.take_screenshot("before_click.png")
+        # Keep the screen before the click in memory
+        frames["before_click.png"] = capture.grab_bgr()
         
         # Click at center (safe location)
         pyautogui.click(center_x, center_y)
         time.sleep(0.5)
         
-        # Take screenshot after click
-        ui_detection.take_screenshot("after_click.png")
+        # Keep the screen after the click in memory
+        frames["after_click.png"] = capture.grab_bgr()
         
         print(f"   ✅ Clicked at ({center_x}, {center_y})")
         results.append(("Coordinate Click", True))
     except Exception as e:
         print(f"   ❌ Coordinate click failed: {e}")
         results.append(("Coordinate Click", False))
+        for name, frame in frames.items():
+            cv2.imwrite(name, frame)
     
     # Test 5: Screen stability check
     print("5. Testing screen stability check...")
@@ -9,7 +9,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import time
 import pyautogui
-from actions import execute_action, ACTION_HANDLERS
+from actions import execute_action, CLICK_HANDLERS
 import ui_detection
 import verification
 
@@ -23,9 +23,8 @@ def test_basic_click_operations():
     
     # Test 1: Action handlers
     print("1. Testing action handlers...")
-    click_handlers = [h for h in ACTION_HANDLERS.keys() if 'click' in h or h == 'close_window']
-    success = len(click_handlers) >= 3  # Should have click_image, click_text, close_window
-    print(f"   [{'PASS' if success else 'FAIL'}] Found {len(click_handlers)} click handlers")
+    success = len(CLICK_HANDLERS) >= 3  # Should have click_image, click_text, close_window
+    print(f"   [{'PASS' if success else 'FAIL'}] Found {len(CLICK_HANDLERS)} click handlers")
     results.append(("Action Handlers", success))
     
     # Test 2: Screenshot functionality
@@ -53,7 +52,7 @@ def test_basic_click_operations():
     # Test 4: Coordinate click
     print("4. Testing coordinate click...")
     try:
-        screen_width, screen_height = pyautogui.size()
+        screen_width, screen_height = ui_detection.get_screen_size()
         center_x, center_y = screen_width // 2, screen_height // 2
         pyautogui.click(center_x, center_y)
         time.sleep(0.5)
@@ -3,8 +3,16 @@ import os
 import sys
 import time
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -21,41 +29,63 @@ class TestFramework:
     
     def __init__(self):
         self.test_results = []
+        self._results_lock = threading.Lock()
+        # get_objectives results by requested id tuple (config isn't modified during a run)
+        self._objectives_cache = {}
         self.config = load_config()
         self.test_start_time = datetime.now()
         
+    # Tests that drive windows, mouse or keyboard - these run one at a time, in order
+    UI_TESTS = (
+        # Phase 1: App Preparation Testing
+        'test_app_preparation_success',
+        'test_app_preparation_failure',
+        # Phase 2: Action Execution Testing
+        'test_action_execution_success',
+        'test_action_execution_failure',
+        # Phase 3: Objective Workflow Testing
+        'test_single_objective_execution',
+        'test_multiple_objectives_sequence',
+    )
+    
+    # Tests that never touch the screen (config lookups, email, placeholders), run
+    # on worker threads alongside the UI tests so SMTP waits overlap with them
+    BACKGROUND_TESTS = (
+        'test_app_preparation_retry_success',
+        'test_action_execution_retry_success',
+        'test_mixed_objectives',
+        # Phase 4: Error Strategy Testing
+        'test_error_strategy_retry_previous',
+        'test_error_strategy_email_dev',
+        'test_error_strategy_rollback_all',
+        # Phase 5: Email Notification Testing
+        'test_email_notifications',
+    )
+    
     def run_all_tests(self):
         """Run all test scenarios"""
         print("=" * 60)
         print("AUTOMATION FRAMEWORK TESTING SUITE")
         print("=" * 60)
         
-        # Phase 1: App Preparation Testing
-        self.test_app_preparation_success()
-        self.test_app_preparation_failure()
-        self.test_app_preparation_retry_success()
-        
-        # Phase 2: Action Execution Testing
-        self.test_action_execution_success()
-        self.test_action_execution_retry_success()
-        self.test_action_execution_failure()
-        
-        # Phase 3: Objective Workflow Testing
-        self.test_single_objective_execution()
-        self.test_multiple_objectives_sequence()
-        self.test_mixed_objectives()
-        
-        # Phase 4: Error Strategy Testing
-        self.test_error_strategy_retry_previous()
-        self.test_error_strategy_email_dev()
-        self.test_error_strategy_rollback_all()
-        
-        # Phase 5: Email Notification Testing
-        self.test_email_notifications()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            background = [pool.submit(getattr(self, name)) for name in self.BACKGROUND_TESTS]
+            
+            for name in self.UI_TESTS:
+                getattr(self, name)()
+            
+            for future in background:
+                future.result()
         
         # Generate Test Report
         self.generate_test_report()
         
+    def _get_objectives(self, *objective_ids):
+        """get_objectives for this run's config, computed once per id list"""
+        if objective_ids not in self._objectives_cache:
+            self._objectives_cache[objective_ids] = get_objectives(self.config, list(objective_ids))
+        return self._objectives_cache[objective_ids]
+    
     def test_app_preparation_success(self):
         """Test: App launches successfully on first attempt"""
         print("\n[TEST] Testing: App Preparation Success")
@@ -135,7 +165,7 @@ class TestFramework:
         
         try:
             # Get a simple objective
-            objectives = get_objectives(self.config, ['notepad_basic_typing'])
+            objectives = self._get_objectives('notepad_basic_typing')
             if objectives[0]:
                 supported, _ = objectives
                 if supported:
@@ -199,7 +229,7 @@ class TestFramework:
         
         try:
             # Test with a simple objective
-            objectives = get_objectives(self.config, ['notepad_basic_typing'])
+            objectives = self._get_objectives('notepad_basic_typing')
             if objectives[0]:
                 supported, _ = objectives
                 if supported:
@@ -225,7 +255,7 @@ class TestFramework:
         
         try:
             # Test with multiple objectives
-            objectives = get_objectives(self.config, ['notepad_basic_typing', 'notepad_delete_and_close'])
+            objectives = self._get_objectives('notepad_basic_typing', 'notepad_delete_and_close')
             if objectives[0]:
                 supported, _ = objectives
                 if len(supported) >= 2:
@@ -253,7 +283,7 @@ class TestFramework:
         
         try:
             # Test with mixed objectives
-            objectives = get_objectives(self.config, ['notepad_basic_typing', 'notepad_unsupported_feature'])
+            objectives = self._get_objectives('notepad_basic_typing', 'notepad_unsupported_feature')
             if objectives[0]:
                 supported, unsupported = objectives
                 
@@ -328,7 +358,8 @@ class TestFramework:
             'message': message,
             'timestamp': datetime.now().isoformat()
         }
-        self.test_results.append(result)
+        with self._results_lock:
+            self.test_results.append(result)
         
         status_emoji = {
             'PASS': '[PASS]',
@@ -346,10 +377,11 @@ class TestFramework:
         print("=" * 60)
         
         total_tests = len(self.test_results)
-        passed = len([r for r in self.test_results if r['status'] == 'PASS'])
-        failed = len([r for r in self.test_results if r['status'] == 'FAIL'])
-        errors = len([r for r in self.test_results if r['status'] == 'ERROR'])
-        skipped = len([r for r in self.test_results if r['status'] == 'SKIP'])
+        status_counts = Counter(r['status'] for r in self.test_results)
+        passed = status_counts['PASS']
+        failed = status_counts['FAIL']
+        errors = status_counts['ERROR']
+        skipped = status_counts['SKIP']
         
         print(f"Total Tests: {total_tests}")
         print(f"[PASS] Passed: {passed}")
@@ -375,17 +407,22 @@ class TestFramework:
         }
         
         report_file = f"test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_file, 'w') as f:
-            json.dump(report_data, f, indent=2)
+        # orjson serializes straight to bytes when installed; same indented layout either way
+        if orjson is not None:
+            report_bytes = orjson.dumps(report_data, option=orjson.OPT_INDENT_2)
+        else:
+            report_bytes = json.dumps(report_data, indent=2).encode('utf-8')
+        with open(report_file, 'wb') as f:
+            f.write(report_bytes)
         
         print(f"\nDetailed report saved: {report_file}")
         
         # Print failed tests
-        if failed > 0 or errors > 0:
+        failed_items = [r for r in self.test_results if r['status'] in ('FAIL', 'ERROR')]
+        if failed_items:
             print("\n[FAIL] FAILED/ERROR TESTS:")
-            for result in self.test_results:
-                if result['status'] in ['FAIL', 'ERROR']:
-                    print(f"  - {result['test_name']}: {result['message']}")
+            for result in failed_items:
+                print(f"  - {result['test_name']}: {result['message']}")
 
 
 if __name__ == "__main__":
@@ -1,10 +1,38 @@
 """UI Detection utilities - Template matching, screenshots, and verification"""
 import time
+import functools
+import hashlib
+from collections import OrderedDict
 import cv2
 import numpy as np
 import pyautogui
 import os
+import shutil
+import ctypes
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
+import capture
+
+# Tesseract's OpenMP threading is slower than single-threaded OCR run side by
+# side - cap it before tesserocr loads libtesseract in-process, and before any
+# OCR subprocess is spawned
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    from tesserocr import PyTessBaseAPI, PSM, OEM, RIL, iterate_level
+except ImportError:
+    PyTessBaseAPI = None
+
+try:
+    from pywinauto import Desktop
+except Exception:
+    Desktop = None
 
 
 def take_screenshot(save_path="screenshots/screen.png"):
@@ -20,8 +48,8 @@ def take_screenshot(save_path="screenshots/screen.png"):
         # Ensure directory exists
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
         
-        screenshot = pyautogui.screenshot()
-        screenshot.save(save_path)
+        if not cv2.imwrite(save_path, capture.grab_bgr()):
+            raise IOError(f"could not write {save_path}")
         print(f"Screenshot saved: {save_path}")
         return save_path
     except Exception as e:
@@ -29,6 +57,119 @@ def take_screenshot(save_path="screenshots/screen.png"):
         return ""
 
 
+@functools.lru_cache(maxsize=128)
+def _decode_template(template_path, mtime):
+    """Decode a template file as grayscale (cached per path and modification time)"""
+    template = cv2.imread(template_path, cv2.IMREAD_GRAYSCALE)
+    if template is not None:
+        template.setflags(write=False)
+    return template
+
+
+def _load_template(template_path):
+    """Load a template image as grayscale, decoding each file only once
+
+    A template that is re-captured on disk is picked up on the next call.
+
+    Args:
+        template_path: Path to template image file
+
+    Returns:
+        Read-only grayscale numpy array, or None if the file can't be decoded
+    """
+    try:
+        mtime = os.path.getmtime(template_path)
+    except OSError:
+        return None
+    return _decode_template(template_path, mtime)
+
+
+# Coarse-to-fine matching: templates smaller than this (in pixels, either side)
+# lose too much detail at half resolution and are matched directly
+_PYRAMID_MIN_TEMPLATE_SIDE = 24
+_COARSE_CANDIDATES = 5
+_REFINE_MARGIN = 4
+# Small templates are located with the cheaper TM_SQDIFF; a CCOEFF score this
+# good around that spot is trusted, anything less gets the full CCOEFF search
+_SQDIFF_CONFIRM_SCORE = 0.9
+
+# Full-screen matches run through OpenCV's T-API (OpenCL) when a device is
+# available - the screen is uploaded once and only small results come back
+_USE_OPENCL = cv2.ocl.haveOpenCL()
+if _USE_OPENCL:
+    cv2.ocl.setUseOpenCL(True)
+
+
+def _to_device(image):
+    """Wrap an image as a cv2.UMat when OpenCL is available, else return it unchanged"""
+    return cv2.UMat(image) if _USE_OPENCL else image
+
+
+def _match_template(screenshot_gray, template_gray):
+    """Locate a template at native scale using TM_CCOEFF_NORMED
+
+    UI templates never change scale, so instead of a multi-scale search the
+    screen and template are both halved with pyrDown, the best few candidate
+    positions are taken from that cheap pass, and full-resolution matching only
+    runs on a small window around each candidate.
+
+    Args:
+        screenshot_gray: Grayscale screen image
+        template_gray: Grayscale template image
+
+    Returns:
+        (max_val, (x, y)) best score and top-left location of the match
+    """
+    template_h, template_w = template_gray.shape
+    screen_h, screen_w = screenshot_gray.shape
+    screen_device = _to_device(screenshot_gray)
+    template_device = _to_device(template_gray)
+
+    if min(template_h, template_w) < _PYRAMID_MIN_TEMPLATE_SIDE:
+        # Locate with plain squared difference (no per-position normalisation),
+        # then score that spot with TM_CCOEFF_NORMED so thresholds mean the same
+        sqdiff = cv2.matchTemplate(screen_device, template_device, cv2.TM_SQDIFF)
+        _, _, (sq_x, sq_y), _ = cv2.minMaxLoc(sqdiff)
+        x0 = max(0, sq_x - _REFINE_MARGIN)
+        y0 = max(0, sq_y - _REFINE_MARGIN)
+        x1 = min(screen_w, sq_x + template_w + _REFINE_MARGIN)
+        y1 = min(screen_h, sq_y + template_h + _REFINE_MARGIN)
+        fine = cv2.matchTemplate(screenshot_gray[y0:y1, x0:x1], template_gray, cv2.TM_CCOEFF_NORMED)
+        _, max_val, _, (fine_x, fine_y) = cv2.minMaxLoc(fine)
+        if max_val >= _SQDIFF_CONFIRM_SCORE:
+            return max_val, (x0 + fine_x, y0 + fine_y)
+
+        # Weak or brightness-shifted match - fall back to the full search
+        result = cv2.matchTemplate(screen_device, template_device, cv2.TM_CCOEFF_NORMED)
+        _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        return max_val, max_loc
+
+    coarse = cv2.matchTemplate(cv2.pyrDown(screen_device), cv2.pyrDown(template_device), cv2.TM_CCOEFF_NORMED)
+    if isinstance(coarse, cv2.UMat):
+        # Candidate suppression below edits the score map in place
+        coarse = coarse.get()
+
+    best_val, best_loc = -1.0, (0, 0)
+    for _ in range(_COARSE_CANDIDATES):
+        _, _, _, (coarse_x, coarse_y) = cv2.minMaxLoc(coarse)
+
+        # Refine around the candidate at full resolution
+        x0 = max(0, coarse_x * 2 - _REFINE_MARGIN)
+        y0 = max(0, coarse_y * 2 - _REFINE_MARGIN)
+        x1 = min(screen_w, coarse_x * 2 + template_w + _REFINE_MARGIN)
+        y1 = min(screen_h, coarse_y * 2 + template_h + _REFINE_MARGIN)
+        fine = cv2.matchTemplate(screenshot_gray[y0:y1, x0:x1], template_gray, cv2.TM_CCOEFF_NORMED)
+        _, fine_val, _, (fine_x, fine_y) = cv2.minMaxLoc(fine)
+        if fine_val > best_val:
+            best_val, best_loc = fine_val, (x0 + fine_x, y0 + fine_y)
+
+        # Suppress this candidate's neighbourhood before picking the next one
+        coarse[max(0, coarse_y - template_h // 4):coarse_y + template_h // 4 + 1,
+               max(0, coarse_x - template_w // 4):coarse_x + template_w // 4 + 1] = -1.0
+
+    return best_val, best_loc
+
+
 def find_template(template_path, threshold=0.4, region=None, screenshot_path=None):
     """Find template image on screen using OpenCV template matching
     
@@ -46,17 +187,14 @@ def find_template(template_path, threshold=0.4, region=None, screenshot_path=Non
         return None
 
     try:
-        # Take screenshot if not provided
-        if not screenshot_path:
-            screenshot_path = take_screenshot()
-        if not screenshot_path:
-            return None
-
-        # Load images
-        screenshot = cv2.imread(screenshot_path)
-        template = cv2.imread(template_path)
+        # Use the shared in-memory capture unless an existing screenshot is given
+        if screenshot_path:
+            screenshot_gray = cv2.imread(screenshot_path, cv2.IMREAD_GRAYSCALE)
+        else:
+            screenshot_gray = capture.get_latest_gray()
+        template_gray = _load_template(template_path)
 
-        if screenshot is None or template is None:
+        if screenshot_gray is None or template_gray is None:
             print("Error loading images for template matching")
             return None
 
@@ -64,16 +202,11 @@ def find_template(template_path, threshold=0.4, region=None, screenshot_path=Non
         region_offset_x, region_offset_y = 0, 0
         if region:
             x, y, w, h = region
-            screenshot = screenshot[y:y+h, x:x+w]
+            screenshot_gray = screenshot_gray[y:y+h, x:x+w]
             region_offset_x, region_offset_y = x, y
 
-        # Convert to grayscale
-        screenshot_gray = cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
-        template_gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
-
         # Template matching
-        result = cv2.matchTemplate(screenshot_gray, template_gray, cv2.TM_CCOEFF_NORMED)
-        _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        max_val, max_loc = _match_template(screenshot_gray, template_gray)
 
         if max_val >= threshold:
             # Calculate center of matched region
@@ -210,6 +343,25 @@ def find_multiple_templates(template_paths, threshold=0.8):
     return results
 
 
+def dhash(gray_image):
+    """64-bit difference hash of a grayscale image - a cheap screen fingerprint
+    
+    Args:
+        gray_image: 2D uint8 numpy array
+        
+    Returns:
+        int with one bit per horizontal gradient of a 9x8 downsample
+    """
+    small = cv2.resize(gray_image, (9, 8), interpolation=cv2.INTER_AREA)
+    bits = small[:, 1:] > small[:, :-1]
+    return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+
+
+def hash_distance(hash_a, hash_b):
+    """Number of differing bits between two dhash values"""
+    return bin(hash_a ^ hash_b).count('1')
+
+
 def detect_screen_change(previous_screenshot_path, current_screenshot_path=None, threshold=10.0):
     """Detect if screen has changed between two screenshots
     
@@ -334,9 +486,13 @@ def cleanup_screenshots(screenshot_dir="screenshots", patterns=None):
         print(f"Error cleaning up screenshots: {e}")
 
 
+@functools.lru_cache(maxsize=1)
 def get_screen_size():
     """Get screen dimensions
     
+    Queried once per process - call get_screen_size.cache_clear() after a
+    display resolution change.
+    
     Returns:
         (width, height) of screen
     """
@@ -434,6 +590,294 @@ def verify_screen_ready_for_action(action_type, timeout=3):
         return True
 
 
+# OCR results keyed by a hash of the recognised pixels, so polling an unchanged
+# screen (e.g. wait_for_text) doesn't re-run OCR
+_OCR_CACHE = OrderedDict()
+_OCR_CACHE_SIZE = 64
+_OCR_CACHE_TTL = 2.0
+_OCR_CACHE_LOCK = threading.Lock()
+
+
+def _image_digest(image):
+    """Hash the raw pixel bytes of a PIL image (xxhash when installed, md5 otherwise)"""
+    data = image.tobytes()
+    if xxhash is not None:
+        return xxhash.xxh64(data).intdigest()
+    return hashlib.md5(data).digest()
+
+
+def cached_ocr(image, cache_key, run_ocr):
+    """Run OCR on an image, reusing a recent result if the pixels are unchanged
+    
+    Args:
+        image: PIL image to recognise
+        cache_key: Hashable description of the OCR call (engine and config)
+        run_ocr: Callable taking the image and returning the OCR result
+        
+    Returns:
+        Result of run_ocr (shared with other callers - don't modify it)
+    """
+    key = (_image_digest(image), image.size, image.mode, cache_key)
+    now = time.time()
+
+    with _OCR_CACHE_LOCK:
+        entry = _OCR_CACHE.get(key)
+        if entry is not None and now - entry[1] <= _OCR_CACHE_TTL:
+            _OCR_CACHE.move_to_end(key)
+            return entry[0]
+
+    # OCR runs outside the lock so parallel text checks don't serialise
+    result = run_ocr(image)
+    with _OCR_CACHE_LOCK:
+        _OCR_CACHE[key] = (result, now)
+        _OCR_CACHE.move_to_end(key)
+        while len(_OCR_CACHE) > _OCR_CACHE_SIZE:
+            _OCR_CACHE.popitem(last=False)
+    return result
+
+
+# One in-process Tesseract API per thread (the API isn't thread-safe), loaded
+# once instead of spawning tesseract.exe and re-reading traineddata per call
+# Default Windows install location, used when tesseract isn't on PATH
+_WINDOWS_TESSERACT = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
+
+
+_tesseract_cmd_checked = False
+
+
+def _configure_tesseract_cmd(pytesseract):
+    """Point pytesseract at the default Windows install if tesseract isn't on PATH (checked once)"""
+    global _tesseract_cmd_checked
+    if not _tesseract_cmd_checked:
+        if shutil.which('tesseract') is None and os.path.exists(_WINDOWS_TESSERACT):
+            pytesseract.pytesseract.tesseract_cmd = _WINDOWS_TESSERACT
+        _tesseract_cmd_checked = True
+
+
+_tesserocr_local = threading.local()
+_tesserocr_failed = False
+
+
+def _get_tesserocr_api():
+    """Get this thread's preloaded tesserocr API, creating it on first use"""
+    api = getattr(_tesserocr_local, 'api', None)
+    if api is None:
+        # Sparse text suits UI screens; LSTM only skips the legacy engine
+        api = PyTessBaseAPI(lang='eng', psm=PSM.SPARSE_TEXT, oem=OEM.LSTM_ONLY)
+        api.SetVariable('tessedit_do_invert', '0')
+        _tesserocr_local.api = api
+    return api
+
+
+def _tesserocr_words(image):
+    """Recognise words in-process with tesserocr"""
+    api = _get_tesserocr_api()
+    api.SetImage(image)
+    api.Recognize()
+
+    words = []
+    iterator = api.GetIterator()
+    if iterator is None:
+        return words
+
+    line = 0
+    for result in iterate_level(iterator, RIL.WORD):
+        if result.IsAtBeginningOf(RIL.TEXTLINE):
+            line += 1
+        detected_text = (result.GetUTF8Text(RIL.WORD) or '').strip()
+        box = result.BoundingBox(RIL.WORD)
+        if not detected_text or box is None:
+            continue
+        x1, y1, x2, y2 = box
+        words.append({
+            'text': detected_text,
+            'bbox': (x1, y1, x2 - x1, y2 - y1),
+            'confidence': result.Confidence(RIL.WORD) / 100.0,
+            'line': (0, 0, line)
+        })
+    return words
+
+
+def _tesseract_words(image):
+    """Run Tesseract once over an image and collect every recognised word
+    
+    Uses tesserocr when installed, otherwise the pytesseract subprocess.
+    """
+    global _tesserocr_failed
+    if PyTessBaseAPI is not None and not _tesserocr_failed:
+        try:
+            return _tesserocr_words(image)
+        except Exception as e:
+            print(f"[WARN] tesserocr failed: {e} - falling back to pytesseract")
+            _tesserocr_failed = True
+
+    import pytesseract
+    _configure_tesseract_cmd(pytesseract)
+
+    data = pytesseract.image_to_data(image, config='--oem 1 --psm 11', output_type=pytesseract.Output.DICT)
+
+    words = []
+    for i in range(len(data['text'])):
+        detected_text = str(data['text'][i]).strip()
+        if not detected_text:
+            continue
+        try:
+            confidence = float(data['conf'][i]) / 100.0
+        except Exception:
+            confidence = 1.0
+        words.append({
+            'text': detected_text,
+            'bbox': (int(data['left'][i]), int(data['top'][i]), int(data['width'][i]), int(data['height'][i])),
+            'confidence': confidence,
+            'line': (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+        })
+    return words
+
+
+# Full screens are read as a grid of tiles: Tesseract is quicker on smaller,
+# document-shaped images, tiles OCR in parallel, and an unchanged tile hits
+# the OCR cache even when another part of the screen has changed
+_OCR_TILE_GRID = (3, 2)  # columns, rows - 640x540 tiles on a 1080p screen
+_OCR_TILE_OVERLAP = 48  # pixels shared with neighbouring tiles so seam words are read whole
+_OCR_BLANK_STDDEV = 5.0  # tiles flatter than this hold no text and are skipped
+
+_ocr_tile_pool = None
+
+
+def _get_ocr_tile_pool():
+    """Create the OCR tile worker pool on first use"""
+    global _ocr_tile_pool
+    if _ocr_tile_pool is None:
+        _ocr_tile_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+    return _ocr_tile_pool
+
+
+def _ocr_tiles(frame):
+    """OCR a full frame tile by tile and merge the words back into frame coordinates"""
+    height, width = frame.shape[:2]
+    cols, rows = _OCR_TILE_GRID
+    tile_w = -(-width // cols)
+    tile_h = -(-height // rows)
+    pool = _get_ocr_tile_pool()
+
+    jobs = []
+    for row in range(rows):
+        for col in range(cols):
+            core = (col * tile_w, row * tile_h, min(width, (col + 1) * tile_w), min(height, (row + 1) * tile_h))
+            x1 = max(0, core[0] - _OCR_TILE_OVERLAP)
+            y1 = max(0, core[1] - _OCR_TILE_OVERLAP)
+            x2 = min(width, core[2] + _OCR_TILE_OVERLAP)
+            y2 = min(height, core[3] + _OCR_TILE_OVERLAP)
+            tile = frame[y1:y2, x1:x2]
+            if tile.size == 0 or np.std(tile) < _OCR_BLANK_STDDEV:
+                continue
+            image = Image.fromarray(np.ascontiguousarray(tile))
+            future = pool.submit(cached_ocr, image, 'tesseract_words', _tesseract_words)
+            jobs.append((core, (x1, y1), future))
+
+    words = []
+    for index, (core, (tile_x, tile_y), future) in enumerate(jobs):
+        for word in future.result():
+            x, y, w, h = word['bbox']
+            x += tile_x
+            y += tile_y
+            center_x, center_y = x + w//2, y + h//2
+            # Keep each word once - from the tile whose own area holds its centre
+            if not (core[0] <= center_x < core[2] and core[1] <= center_y < core[3]):
+                continue
+            words.append(dict(word, bbox=(x, y, w, h), line=(index,) + tuple(word['line'])))
+    return words
+
+
+def ocr_full_screen(region=None):
+    """Recognise every word on the screen (or a region) in a single OCR pass
+    
+    The word list is cached by a hash of the pixels, so any number of text
+    queries against the same screen share one Tesseract run. Without a region
+    the screen is read as parallel tiles (see _OCR_TILE_GRID).
+    
+    Args:
+        region: Optional region to read (x, y, width, height)
+        
+    Returns:
+        List of dicts with 'text', 'bbox', 'confidence', 'center' and 'line'
+        for each word, with bbox/center in screen coordinates
+    """
+    frame = capture.get_latest_gray()
+    if not region:
+        words = _ocr_tiles(frame)
+        return [dict(word, center=(word['bbox'][0] + word['bbox'][2]//2, word['bbox'][1] + word['bbox'][3]//2))
+                for word in words]
+
+    x, y, w, h = region
+    words = cached_ocr(Image.fromarray(np.ascontiguousarray(frame[y:y+h, x:x+w])), 'tesseract_words', _tesseract_words)
+
+    screen_words = []
+    for word in words:
+        wx, wy, ww, wh = word['bbox']
+        wx += x
+        wy += y
+        screen_words.append(dict(word, bbox=(wx, wy, ww, wh), center=(wx + ww//2, wy + wh//2)))
+    return screen_words
+
+
+def find_text_in_words(words, text, confidence_threshold=0.0):
+    """Search an OCR word list (see ocr_full_screen) for text
+    
+    Single words match as a case-insensitive substring of a recognised word;
+    multi-word text is also matched against whole lines, returning the box
+    spanning the words it covers.
+    
+    Args:
+        words: Word list from ocr_full_screen
+        text: Text to search for
+        confidence_threshold: Minimum confidence for a word to be considered
+        
+    Returns:
+        List of dicts with 'text', 'bbox', 'confidence', 'center' for each match
+    """
+    text_lower = text.lower().strip()
+    if not text_lower:
+        return []
+
+    candidates = [word for word in words if word['confidence'] >= confidence_threshold]
+    matches = [word for word in candidates if text_lower in word['text'].lower()]
+    if matches or ' ' not in text_lower:
+        return matches
+
+    lines = OrderedDict()
+    for word in candidates:
+        lines.setdefault(word['line'], []).append(word)
+
+    for line_words in lines.values():
+        line_text = ' '.join(word['text'] for word in line_words).lower()
+        start = line_text.find(text_lower)
+        if start < 0:
+            continue
+        end = start + len(text_lower)
+
+        # Words whose characters overlap the matched span
+        spanned = []
+        pos = 0
+        for word in line_words:
+            word_end = pos + len(word['text'])
+            if word_end > start and pos < end:
+                spanned.append(word)
+            pos = word_end + 1
+
+        x1 = min(word['bbox'][0] for word in spanned)
+        y1 = min(word['bbox'][1] for word in spanned)
+        x2 = max(word['bbox'][0] + word['bbox'][2] for word in spanned)
+        y2 = max(word['bbox'][1] + word['bbox'][3] for word in spanned)
+        matches.append({
+            'text': ' '.join(word['text'] for word in spanned),
+            'bbox': (x1, y1, x2 - x1, y2 - y1),
+            'confidence': min(word['confidence'] for word in spanned),
+            'center': ((x1 + x2) // 2, (y1 + y2) // 2)
+        })
+    return matches
+
+
 def find_text_with_bounding_boxes(text, region=None, confidence_threshold=0.8, save_debug=False):
     """Find text using OCR and return bounding boxes for precise clicking
     
@@ -489,35 +933,41 @@ def find_text_with_bounding_boxes(text, region=None, confidence_threshold=0.8, s
         except Exception:
             paddle_available = False
 
-        # If region cropping requested, crop first and pass to OCR
-        screenshot_path = _ensure_screenshot()
-        if not screenshot_path:
-            return []
-
-        # Load original image with PIL to crop and for debug drawing
-        try:
-            pil_img = Image.open(screenshot_path)
-        except Exception:
-            pil_img = None
-
-        region_offset = (0, 0)
-        if region and pil_img is not None:
-            x, y, w, h = region
-            pil_crop = pil_img.crop((x, y, x+w, y+h))
-            region_offset = (x, y)
-            # Save the cropped region to a temp file for PaddleOCR if needed
-            temp_crop_path = "screenshots/ocr_crop.png"
-            pil_crop.save(temp_crop_path)
-            ocr_input_path = temp_crop_path
-        else:
-            ocr_input_path = screenshot_path
-
         matches = []
 
         if paddle_available:
             try:
-                ocr = PaddleOCR(use_angle_cls=True, lang='en')
-                result = ocr.ocr(ocr_input_path, cls=True)
+                # If region cropping requested, crop first and pass to OCR
+                screenshot_path = _ensure_screenshot()
+                if not screenshot_path:
+                    return []
+
+                # Load original image with PIL to crop
+                try:
+                    pil_img = Image.open(screenshot_path)
+                except Exception:
+                    pil_img = None
+
+                region_offset = (0, 0)
+                if region and pil_img is not None:
+                    x, y, w, h = region
+                    pil_crop = pil_img.crop((x, y, x+w, y+h))
+                    region_offset = (x, y)
+                    # Save the cropped region to a temp file for PaddleOCR
+                    temp_crop_path = "screenshots/ocr_crop.png"
+                    pil_crop.save(temp_crop_path)
+                    ocr_input_path = temp_crop_path
+                else:
+                    ocr_input_path = screenshot_path
+
+                def _run_paddle(_image):
+                    ocr = PaddleOCR(use_angle_cls=True, lang='en')
+                    return ocr.ocr(ocr_input_path, cls=True)
+
+                if pil_img is not None:
+                    result = cached_ocr(pil_crop if region else pil_img, 'paddleocr', _run_paddle)
+                else:
+                    result = _run_paddle(None)
                 # result is a list of lists; flatten
                 flattened = []
                 for r in result:
@@ -533,56 +983,19 @@ def find_text_with_bounding_boxes(text, region=None, confidence_threshold=0.8, s
                 print(f"[WARN] PaddleOCR failed: {e} - falling back to pytesseract")
                 paddle_available = False
 
-        # If Paddle not available or failed, use pytesseract
+        # If Paddle not available or failed, search the shared Tesseract word list
         if not paddle_available:
             try:
-                import pytesseract
-                from PIL import ImageDraw
-                # keep original Windows tesseract location, but don't force it
-                if os.name == 'nt' and not getattr(pytesseract.pytesseract, 'tesseract_cmd', None):
-                    pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
+                matches = find_text_in_words(ocr_full_screen(region), text, confidence_threshold)
 
-                # Use PIL image (cropped if needed)
-                if region and pil_img is not None:
-                    image_for_ocr = pil_crop
-                else:
-                    image_for_ocr = pil_img if pil_img is not None else Image.open(screenshot_path)
-
-                ocr_data = pytesseract.image_to_data(image_for_ocr, output_type=pytesseract.Output.DICT)
-                text_lower = text.lower()
-
-                for i in range(len(ocr_data['text'])):
-                    detected_text = str(ocr_data['text'][i]).strip()
-                    try:
-                        confidence = float(ocr_data['conf'][i]) / 100.0
-                    except Exception:
-                        confidence = 1.0
-
-                    if detected_text and confidence >= confidence_threshold:
-                        if text_lower in detected_text.lower():
-                            lx = int(ocr_data['left'][i]) + region_offset[0]
-                            ly = int(ocr_data['top'][i]) + region_offset[1]
-                            lw = int(ocr_data['width'][i])
-                            lh = int(ocr_data['height'][i])
-                            match = {
-                                'text': detected_text,
-                                'bbox': (lx, ly, lw, lh),
-                                'confidence': confidence,
-                                'center': (lx + lw//2, ly + lh//2)
-                            }
-                            matches.append(match)
-
-                if save_debug and matches and image_for_ocr is not None:
-                    debug_image = image_for_ocr.copy()
+                if save_debug and matches:
+                    from PIL import ImageDraw
+                    debug_image = Image.fromarray(capture.get_latest_gray()).convert('RGB')
                     draw = ImageDraw.Draw(debug_image)
                     for match in matches:
                         x, y, w, h = match['bbox']
-                        if region:
-                            # when drawing on cropped image, adjust
-                            draw.rectangle([x-region_offset[0], y-region_offset[1], x-region_offset[0]+w, y-region_offset[1]+h], outline='red', width=2)
-                        else:
-                            draw.rectangle([x, y, x+w, y+h], outline='red', width=2)
-                        draw.text((max(0, x-region_offset[0]), max(0, y-region_offset[1])-20), f"{match['confidence']:.2f}", fill='red')
+                        draw.rectangle([x, y, x+w, y+h], outline='red', width=2)
+                        draw.text((x, max(0, y-20)), f"{match['confidence']:.2f}", fill='red')
                     debug_path = "screenshots/ocr_debug.png"
                     debug_image.save(debug_path)
                     print(f"[DEBUG] OCR debug image saved: {debug_path}")
@@ -686,14 +1099,102 @@ def smart_crop_for_ocr(image_path, text_hint=None, min_text_size=20):
         return []
 
 
+# UI Automation text lookup - exact control names straight from the app, no
+# pixels involved. The foreground window's named elements are cached briefly
+# so polling (wait_for_text) doesn't re-walk the tree every check.
+# UIA lookups also run on OCR and read-only action worker threads: the cache is
+# shared under a lock, and elements are only reused by the thread that found
+# them (COM objects belong to the apartment that created them).
+_UIA_CACHE = {'hwnd': None, 'thread': None, 'time': 0.0, 'elements': []}
+_UIA_CACHE_TTL = 1.0
+_UIA_LOCK = threading.Lock()
+_com_local = threading.local()
+
+
+def _ensure_com_initialized():
+    """Initialise COM once on the calling thread (comtypes only does the importing thread)"""
+    if not getattr(_com_local, 'initialized', False):
+        # S_FALSE when the thread is already initialised is fine; never uninitialised,
+        # since the worker threads live as long as the process
+        ctypes.windll.ole32.CoInitialize(None)
+        _com_local.initialized = True
+
+
+def _uia_named_elements():
+    """(lowercase name, element) pairs for the foreground window's UIA tree"""
+    _ensure_com_initialized()
+    hwnd = ctypes.windll.user32.GetForegroundWindow()
+    thread = threading.get_ident()
+    now = time.time()
+    with _UIA_LOCK:
+        if (_UIA_CACHE['hwnd'] == hwnd and _UIA_CACHE['thread'] == thread
+                and now - _UIA_CACHE['time'] <= _UIA_CACHE_TTL):
+            return _UIA_CACHE['elements']
+
+    window = Desktop(backend='uia').window(handle=hwnd)
+    elements = []
+    for element in window.descendants():
+        name = element.window_text()
+        if name:
+            elements.append((name.lower().strip(), element))
+
+    with _UIA_LOCK:
+        _UIA_CACHE.update(hwnd=hwnd, thread=thread, time=now, elements=elements)
+    return elements
+
+
+def find_uia_element(text, region=None):
+    """Find a visible UI Automation element in the foreground window by its name
+    
+    Args:
+        text: Text to search for (exact name preferred, then substring)
+        region: Optional region the element's centre must fall in (x, y, width, height)
+        
+    Returns:
+        pywinauto element wrapper, or None if pywinauto is unavailable or nothing matches
+    """
+    if Desktop is None:
+        return None
+
+    target = text.lower().strip()
+    try:
+        named = _uia_named_elements()
+        candidates = [element for name, element in named if name == target]
+        candidates += [element for name, element in named if name != target and target in name]
+
+        for element in candidates:
+            if not element.is_visible():
+                continue
+            if region:
+                center = element.rectangle().mid_point()
+                x, y, w, h = region
+                if not (x <= center.x < x + w and y <= center.y < y + h):
+                    continue
+            return element
+    except Exception as e:
+        print(f"[WARN] UI Automation lookup failed: {e}")
+    return None
+
+
+def click_uia_element(element):
+    """Activate a UI Automation element - invoke it if it supports that, else click it"""
+    try:
+        element.invoke()
+    except Exception:
+        element.click_input()
+    # The click will change the UI, so the cached tree is stale
+    with _UIA_LOCK:
+        _UIA_CACHE['hwnd'] = None
+
+
 def find_text_unified(text, region=None, use_smart_crop=True, text_hint=None, return_bounding_boxes=False, click_after_find=False, delay=0.5):
     """Unified text finding with all options - replaces find_text_precise and find_text_with_bounding_boxes
     
     Args:
         text: Text to search for
         region: Optional region to search (x, y, width, height)
-        use_smart_crop: Use intelligent cropping for better OCR
-        text_hint: Hint about text location for cropping
+        use_smart_crop: Search the whole screen before region
+        text_hint: Unused - kept for callers from the file-cropping OCR path
         return_bounding_boxes: Return detailed bounding box information
         click_after_find: Click on the found text
         delay: Delay before clicking
@@ -702,58 +1203,55 @@ def find_text_unified(text, region=None, use_smart_crop=True, text_hint=None, re
         Dict with 'found', 'location', 'confidence', 'bbox' if found
     """
     try:
-        # Take initial screenshot using existing function
-        screenshot_path = take_screenshot("screenshots/ocr_unified.png")
-        if not screenshot_path:
-            return {'found': False, 'error': 'Failed to take screenshot'}
-        
-        # If smart cropping enabled, try cropping first
-        if use_smart_crop:
-            cropped_paths = smart_crop_for_ocr(screenshot_path, text_hint)
-            
-            # Search in each cropped region
-            for i, cropped_path in enumerate(cropped_paths):
-                matches = find_text_with_bounding_boxes(text, save_debug=True)
-                if matches:
-                    # Return the best match
-                    best_match = max(matches, key=lambda m: m['confidence'])
-                    result = {
-                        'found': True,
-                        'location': best_match['center'],
-                        'confidence': best_match['confidence'],
-                        'bbox': best_match['bbox'],
-                        'text': best_match['text'],
-                        'method': 'smart_crop'
-                    }
-                    
-                    # Click if requested
-                    if click_after_find and result['found']:
-                        time.sleep(delay)
-                        click_at_location(result['location'])
-                        print(f"Clicked on text '{text}' at {result['location']}")
-                    
-                    return result
-        
-        # Fallback to regular search
-        matches = find_text_with_bounding_boxes(text, region, save_debug=True)
-        if matches:
-            best_match = max(matches, key=lambda m: m['confidence'])
+        # Controls that expose their name through UI Automation need no OCR at all
+        element = find_uia_element(text, region)
+        if element is not None:
+            rect = element.rectangle()
+            center = rect.mid_point()
             result = {
                 'found': True,
-                'location': best_match['center'],
-                'confidence': best_match['confidence'],
-                'bbox': best_match['bbox'],
-                'text': best_match['text'],
-                'method': 'regular'
+                'location': (center.x, center.y),
+                'confidence': 1.0,
+                'bbox': (rect.left, rect.top, rect.width(), rect.height()),
+                'text': element.window_text(),
+                'method': 'uia'
             }
-            
-            # Click if requested
-            if click_after_find and result['found']:
+            if click_after_find:
                 time.sleep(delay)
-                click_at_location(result['location'])
-                print(f"Clicked on text '{text}' at {result['location']}")
-            
+                click_uia_element(element)
+                print(f"Clicked on text '{text}' at {result['location']} (UI Automation)")
             return result
+
+        # OCR searches the shared full-screen word list, so there's no screenshot
+        # file to write or crop. Smart-crop mode looks across the whole screen
+        # first (as its crop pass did), then within region if one was given.
+        searches = []
+        if use_smart_crop:
+            searches.append((None, 'smart_crop'))
+        if region or not use_smart_crop:
+            searches.append((region, 'regular'))
+        
+        for search_region, method in searches:
+            matches = find_text_with_bounding_boxes(text, search_region, save_debug=True)
+            if matches:
+                # Return the best match
+                best_match = max(matches, key=lambda m: m['confidence'])
+                result = {
+                    'found': True,
+                    'location': best_match['center'],
+                    'confidence': best_match['confidence'],
+                    'bbox': best_match['bbox'],
+                    'text': best_match['text'],
+                    'method': method
+                }
+                
+                # Click if requested
+                if click_after_find:
+                    time.sleep(delay)
+                    click_at_location(result['location'])
+                    print(f"Clicked on text '{text}' at {result['location']}")
+                
+                return result
         
         return {'found': False, 'error': 'Text not found'}
         
@@ -875,18 +1373,33 @@ def find_and_click_text(text, region=None, use_smart_crop=True, text_hint=None,
 
 
 def verify_text_present(text, region=None, confidence_threshold=0.8):
-    """Check if text is present on screen using OCR - DEPRECATED: Use verify_ocr_text instead
+    """Check if text is present on screen via UI Automation, then the shared OCR word list
     
     Args:
         text: Text to search for
         region: Optional region to search (x, y, width, height)
-        confidence_threshold: Minimum confidence for text detection
+        confidence_threshold: Accepted for compatibility; not applied - every
+            recognised word is searched, as the original full-text OCR check did
         
     Returns:
         True if text found, False otherwise
     """
-    from verification import verify_ocr_text
-    return verify_ocr_text(text, region)
+    if find_uia_element(text, region) is not None:
+        print(f"[UIA] Looking for '{text}' - FOUND")
+        return True
+
+    try:
+        words = ocr_full_screen(region)
+    except ImportError:
+        print("[WARN] pytesseract not installed - text verification disabled")
+        return True  # Skip OCR if not available
+    except Exception as e:
+        print(f"[ERROR] OCR verification failed: {e}")
+        return False
+
+    found = bool(find_text_in_words(words, text, confidence_threshold=0.0))
+    print(f"[OCR] Looking for '{text}' - {'FOUND' if found else 'NOT FOUND'}")
+    return found
 
 
 def wait_for_text(text, timeout=10, region=None, confidence_threshold=0.8, check_interval=0.5):
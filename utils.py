@@ -1,4 +1,8 @@
 """Utility functions for automation framework"""
+import time
+
+# Rule printed above and below banners
+BANNER_RULE = '=' * 60
 
 
 def print_banner(message):
@@ -7,5 +11,39 @@ def print_banner(message):
     Args:
         message: Message to display in banner
     """
-    print(f"\n{'='*60}\n{message}\n{'='*60}")
+    print(f"\n{BANNER_RULE}\n{message}\n{BANNER_RULE}")
+
+
+def new_session_id():
+    """Session id for checkpoints - local start time as YYYYmmdd_HHMMSS
+    
+    Returns:
+        Session id string
+    """
+    return time.strftime("%Y%m%d_%H%M%S")
 
+
+def wait_until(predicate, timeout=0.5, interval=0.02, backoff=1.0, max_interval=None):
+    """Poll a condition until it holds or the timeout expires
+    
+    Args:
+        predicate: Callable returning truthy once the condition is met
+        timeout: Maximum seconds to wait
+        interval: Seconds before the second check
+        backoff: Factor the interval grows by after each check (1.0 = fixed)
+        max_interval: Optional cap on the interval when backing off
+        
+    Returns:
+        True if the condition was met, False on timeout
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        if predicate():
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
+        interval *= backoff
+        if max_interval is not None:
+            interval = min(interval, max_interval)
@@ -1,6 +1,7 @@
 """Action verification utilities - Prerequisites and completion checks"""
 import time
 import ui_detection
+import capture
 from window_ops import find_window, is_window_maximized
 
 
@@ -133,6 +134,10 @@ def verify_action_complete(verification, context):
     return result
 
 
+# dhash bits allowed to differ between checks for the screen to count as stable
+SCREEN_STABLE_MAX_BITS = 3
+
+
 def verify_screen_stable(timeout=3, check_interval=0.5, action_type=None):
     """Verify screen is stable (not changing) with optional action-specific logic
     
@@ -144,19 +149,20 @@ def verify_screen_stable(timeout=3, check_interval=0.5, action_type=None):
     Returns:
         True if screen stable, False if timeout
     """
-    previous_path = ui_detection.take_screenshot("screenshots/stability_check_prev.png")
+    # Compare 64-bit fingerprints of in-memory frames rather than diffing screenshots
+    previous_hash = ui_detection.dhash(capture.get_latest_gray())
     time.sleep(check_interval)
     
     stable_time = 0
     while stable_time < timeout:
-        current_path = ui_detection.take_screenshot("screenshots/stability_check_curr.png")
+        current_hash = ui_detection.dhash(capture.get_latest_gray())
         
-        if not ui_detection.detect_screen_change(previous_path, current_path, threshold=5.0):
+        if ui_detection.hash_distance(previous_hash, current_hash) <= SCREEN_STABLE_MAX_BITS:
             # Screen stable
             return True
         
         # Screen still changing
-        previous_path = current_path
+        previous_hash = current_hash
         time.sleep(check_interval)
         stable_time += check_interval
     
@@ -324,7 +330,11 @@ def verify_ocr_text(expected_text, region=None):
         # Perform OCR with better configuration
         # Use PSM 6 for single text block, PSM 8 for single word
         custom_config = r'--oem 3 --psm 6 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789'
-        text = pytesseract.image_to_string(image, config=custom_config)
+        text = ui_detection.cached_ocr(
+            image,
+            ('tesseract_string', custom_config),
+            lambda img: pytesseract.image_to_string(img, config=custom_config)
+        )
         text = text.strip().lower()
         expected_text = expected_text.strip().lower()
         
@@ -347,7 +357,11 @@ def verify_ocr_text(expected_text, region=None):
             try:
                 # Try PSM 8 for single word
                 fallback_config = r'--oem 3 --psm 8'
-                fallback_text = pytesseract.image_to_string(image, config=fallback_config)
+                fallback_text = ui_detection.cached_ocr(
+                    image,
+                    ('tesseract_string', fallback_config),
+                    lambda img: pytesseract.image_to_string(img, config=fallback_config)
+                )
                 fallback_text = fallback_text.strip().lower()
                 print(f"  [FALLBACK] Alternative OCR result: '{fallback_text}'")
                 
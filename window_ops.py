@@ -1,21 +1,107 @@
 import subprocess
 import time
+import ctypes
+import threading
 import pyautogui
 import pygetwindow as gw
 
 
+def wait_for_input_idle(process, timeout=2):
+    """Wait until a launched process is ready for input (Win32 WaitForInputIdle)
+    
+    Args:
+        process: subprocess.Popen of the launched application
+        timeout: Maximum seconds to wait
+        
+    Returns:
+        True if the process went idle, False on timeout or if it can't be
+        waited on (console apps, launcher stubs that exit, non-Windows)
+    """
+    handle = getattr(process, '_handle', None)
+    if handle is None:
+        return False
+    try:
+        result = ctypes.windll.user32.WaitForInputIdle(int(handle), int(timeout * 1000))
+        return result == 0
+    except Exception:
+        return False
+
+
 def launch_app(app_path, startup_delay=2, args=None):
-    """Launch application and wait"""
+    """Launch application and wait until it is ready for input
+    
+    Args:
+        app_path: Path to the executable
+        startup_delay: Maximum seconds to wait for the app to start
+        args: Optional list of command-line arguments
+        
+    Returns:
+        subprocess.Popen of the launched process
+    """
     cmd = [app_path]
     if args:
         cmd.extend(args)
     # Use shell=False for safety; cmd should be a list (path + args)
-    subprocess.Popen(cmd, shell=False)
-    time.sleep(startup_delay)
-    return True
+    process = subprocess.Popen(cmd, shell=False)
+    # Returns as soon as the app's message loop is idle rather than always
+    # sleeping the full startup delay
+    wait_for_input_idle(process, startup_delay)
+    return process
+
+
+# Held around anything that sends keys or changes the foreground window, so apps
+# prepared in parallel don't interleave their input
+INPUT_LOCK = threading.RLock()
+
+
+# Last window found per app, reused while its hwnd is still alive so repeated
+# lookups skip the window/process scan
+_WINDOW_CACHE = {}
+_WINDOW_CACHE_LOCK = threading.Lock()
+
+
+def _is_live_window(window):
+    """Check a cached window still exists and is usable as-is (not minimized)"""
+    hwnd = getattr(window, '_hWnd', None)
+    if not hwnd:
+        return False
+    try:
+        return bool(ctypes.windll.user32.IsWindow(hwnd)) and not window.isMinimized
+    except Exception:
+        return False
 
 
 def find_window(app_name):
+    """Find window by title, reusing the previous match while it still exists
+    
+    Args:
+        app_name: Application name (matched against window titles)
+        
+    Returns:
+        pygetwindow Window, or None if not found
+    """
+    key = app_name.lower()
+    with _WINDOW_CACHE_LOCK:
+        window = _WINDOW_CACHE.get(key)
+    if window is not None and _is_live_window(window):
+        return window
+
+    window = _scan_for_window(app_name)
+    with _WINDOW_CACHE_LOCK:
+        if window is not None:
+            _WINDOW_CACHE[key] = window
+        else:
+            _WINDOW_CACHE.pop(key, None)
+    return window
+
+
+def invalidate_window(app_name):
+    """Forget the cached window for an app (e.g. after closing it)"""
+    with _WINDOW_CACHE_LOCK:
+        _WINDOW_CACHE.pop(app_name.lower(), None)
+
+
+def _scan_for_window(app_name):
     """Find window by title with enhanced debugging"""
     print(f"  [SEARCH] Looking for window: '{app_name}'")
     if app_name.lower() == "spotify":
@@ -29,7 +115,6 @@ def find_window(app_name):
         # window owned by those processes.
         try:
             import psutil
-            import ctypes
             spotify_pids = set()
             for proc in psutil.process_iter(['pid', 'name', 'exe', 'cmdline']):
                 try:
@@ -142,7 +227,6 @@ def find_window(app_name):
                     hwnd = getattr(window, '_hWnd', None) or getattr(window, 'hWnd', None)
                     if hwnd:
                         try:
-                            import ctypes
                             pid = ctypes.c_ulong()
                             ctypes.windll.user32.GetWindowThreadProcessId(int(hwnd), ctypes.byref(pid))
                             proc = None
@@ -199,6 +283,34 @@ def focus_window(window):
         return False
 
 
+SW_MAXIMIZE = 3
+
+
+def prepare_window(window):
+    """Maximize and focus a window in one go and report whether it ended up maximized
+    
+    Straight user32 calls on the window's handle, no sleeps or visual checks -
+    maximize_window is the slower fallback when this doesn't stick.
+    
+    Args:
+        window: pygetwindow window
+        
+    Returns:
+        True if the window is maximized afterwards, False otherwise
+    """
+    hwnd = getattr(window, '_hWnd', None)
+    if not hwnd:
+        return False
+    try:
+        user32 = ctypes.windll.user32
+        hwnd = int(hwnd)
+        user32.ShowWindow(hwnd, SW_MAXIMIZE)
+        user32.SetForegroundWindow(hwnd)
+        return bool(user32.IsZoomed(hwnd))
+    except Exception:
+        return False
+
+
 def maximize_window(window):
     """Maximize window with enhanced reliability for Spotify Premium"""
     if not window or not window.title:
@@ -307,6 +419,26 @@ def maximize_window(window):
         return False
 
 
+class _RECT(ctypes.Structure):
+    _fields_ = [('left', ctypes.c_long), ('top', ctypes.c_long),
+                ('right', ctypes.c_long), ('bottom', ctypes.c_long)]
+
+
+def _get_window_rect(hwnd):
+    """Read a window's screen rectangle straight from user32
+    
+    Returns:
+        _RECT, or None if the call isn't available or fails
+    """
+    try:
+        rect = _RECT()
+        if ctypes.windll.user32.GetWindowRect(int(hwnd), ctypes.byref(rect)):
+            return rect
+    except Exception:
+        pass
+    return None
+
+
 def is_window_maximized(window):
     """Check if window is maximized with visual verification"""
     if not window:
@@ -317,7 +449,13 @@ def is_window_maximized(window):
     # Try multiple ways to get window rectangle depending on pygetwindow/versions
     try:
         rect = getattr(window, '_rect', None)
-        if rect is None:
+        hwnd = getattr(window, '_hWnd', None)
+        win_rect = _get_window_rect(hwnd) if hwnd else None
+        if win_rect is not None:
+            # One GetWindowRect call instead of one per width/height read
+            width_ratio = (win_rect.right - win_rect.left) / screen_w
+            height_ratio = (win_rect.bottom - win_rect.top) / screen_h
+        elif rect is None:
             # Some versions expose left/top/width/height directly
             left = getattr(window, 'left', None)
             top = getattr(window, 'top', None)
@@ -4,11 +4,12 @@ Handles executing objectives in sequence
 """
 
 import time
-from datetime import datetime
-from actions import execute_action
+from actions import compile_action, compile_actions, execute_actions_parallel, READ_ONLY_ACTION_TYPES, CLICK_ACTION_TYPES
 from verification import verify_prerequisites, verify_action_complete
 from notifications import notify_error
-from state import save_checkpoint
+from state import save_checkpoint, append_history_event
+from utils import new_session_id
+from objectives.mapping import dispatch as dispatch_objective
 
 
 # Predefined workflow sequences
@@ -62,8 +63,11 @@ WORKFLOW_SEQUENCES = {
     ]
 }
 
+# Names only, for "is this token a sequence?" checks
+WORKFLOW_SEQUENCE_NAMES = frozenset(WORKFLOW_SEQUENCES)
 
-def execute_workflow_sequence_by_name(sequence_name, config, session_id=None):
+
+def execute_workflow_sequence_by_name(sequence_name, config, session_id=None, process_snapshot=None):
     """
     Execute a predefined workflow sequence by name
     
@@ -71,11 +75,12 @@ def execute_workflow_sequence_by_name(sequence_name, config, session_id=None):
         sequence_name: Name of the predefined sequence
         config: Configuration object
         session_id: Optional session ID for checkpointing
+        process_snapshot: Optional ProcessSnapshot for the app launch checks
     
     Returns:
         bool: True if sequence completed successfully, False otherwise
     """
-    if sequence_name not in WORKFLOW_SEQUENCES:
+    if sequence_name not in WORKFLOW_SEQUENCE_NAMES:
         print(f"[ERROR] Unknown workflow sequence: {sequence_name}")
         print(f"Available sequences: {list(WORKFLOW_SEQUENCES.keys())}")
         return False
@@ -91,15 +96,15 @@ def execute_workflow_sequence_by_name(sequence_name, config, session_id=None):
     
     app_name = "Spotify"
     try:
-        # Load the full config
-        full_config = load_config()
+        # Callers pass the full top-level config; only load it when they didn't
+        full_config = config if config and 'apps' in config else load_config()
         app_config = get_app_config(full_config, app_name)
     except Exception as e:
         print(f"[ERROR] {e}")
         return False
     
     # Launch, maximize, and verify Spotify
-    if not launch_application(app_name, app_config, max_retries=3):
+    if not launch_application(app_name, app_config, max_retries=3, snapshot=process_snapshot):
         print(f"[FAIL] Failed to launch {app_name}")
         return False
     
@@ -151,7 +156,7 @@ def execute_workflow_sequence(supported_objectives, config, session_id=None):
     
     # Generate session ID if not provided
     if not session_id:
-        session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        session_id = new_session_id()
     
     # Execute each objective in sequence
     for i, objective in enumerate(supported_objectives):
@@ -187,15 +192,14 @@ def execute_single_objective(objective, config, session_id=None):
     print(f"Executing: {objective['name']}")
 
     # If objective has a registered handler, delegate to it.
-    try:
-        from objectives.mapping import get_handler_for_objective_id
-        handler = get_handler_for_objective_id(objective.get('id'))
-        if handler:
+    handler = dispatch_objective(objective.get('id'))
+    if handler:
+        try:
             print(f"  [DISPATCH] Found handler for objective id '{objective.get('id')}' - delegating")
             return handler(objective, config, session_id)
-    except Exception:
-        # If mapping import fails, continue with default flow
-        pass
+        except Exception:
+            # If the handler blows up, continue with default flow
+            pass
 
     # No handler registered -- run the non-dispatching executor
     return execute_single_objective_no_dispatch(objective, config, session_id)
@@ -222,7 +226,48 @@ def execute_single_objective_no_dispatch(objective, config, session_id=None):
     actions = objective.get('actions', [])
     history = []
 
-    for i, action in enumerate(actions):
+    # Compile (and validate) the whole script before running any of it
+    try:
+        steps = compile_actions(actions)
+    except ValueError as e:
+        print(f"[FAIL] Invalid action in objective '{objective['name']}': {e}")
+        return False
+
+    def record_success(i, action):
+        history.append(action)
+        context['history'] = history  # Update context with current history
+
+        # Log the action and save checkpoint after each successful action
+        if session_id:
+            append_history_event(session_id, objective['id'], i + 1, action)
+            save_checkpoint(session_id, objective['id'], i + 1, history)
+            print(f"  [CHECKPOINT] Saved progress: {len(history)} action(s) completed")
+
+    i = 0
+    while i < len(actions):
+        # Neighbouring read-only text checks don't depend on each other - run them together
+        batch = _read_only_batch(actions, i)
+        if len(batch) > 1:
+            print(f"Actions {i+1}-{i+len(batch)}/{len(actions)}: {len(batch)} read-only checks in parallel")
+            # Same settle-and-focus as the serial path, once for the whole batch
+            _prepare_for_action(context)
+            try:
+                results = execute_actions_parallel(batch)
+            except Exception as e:
+                print(f"  [WARN] Parallel checks failed: {e} - running them one by one")
+                results = [False] * len(batch)
+
+            for action, success in zip(batch, results):
+                if not success:
+                    # The parallel run was the first attempt - the retry path gets the rest
+                    success = execute_action_with_retry(action, max_retries=2, context=context, step=steps[i])
+                if not success:
+                    return handle_action_failure(action, history, "execution_failed")
+                record_success(i, action)
+                i += 1
+            continue
+
+        action = actions[i]
         print(f"Action {i+1}/{len(actions)}: {action['type']}")
 
         # Check prerequisites before action
@@ -234,24 +279,54 @@ def execute_single_objective_no_dispatch(objective, config, session_id=None):
                 return handle_action_failure(action, history, "prerequisites_not_met")
 
         # Execute with retry and error handling
-        success = execute_action_with_retry(action, max_retries=3, context=context)
+        success = execute_action_with_retry(action, max_retries=3, context=context, step=steps[i])
 
         if not success:
             return handle_action_failure(action, history, "execution_failed")
 
-        history.append(action)
-        context['history'] = history  # Update context with current history
-
-        # Save checkpoint after each successful action
-        if session_id:
-            save_checkpoint(session_id, objective['id'], i + 1, history)
-            print(f"  [CHECKPOINT] Saved progress: {len(history)} action(s) completed")
+        record_success(i, action)
+        i += 1
 
     print(f"[OK] Objective '{objective['name']}' completed successfully")
     return True
 
 
-def execute_action_with_retry(action, max_retries=3, context=None):
+def _read_only_batch(actions, start):
+    """Collect the run of read-only actions starting at start
+    
+    Actions with prerequisites or a verification block end the run - those
+    checks only happen in execute_action_with_retry.
+    """
+    batch = []
+    for action in actions[start:]:
+        if (action.get('type') not in READ_ONLY_ACTION_TYPES
+                or action.get('prerequisites') or action.get('verification')):
+            break
+        batch.append(action)
+    return batch
+
+
+def _prepare_for_action(context):
+    """Wait for the screen to settle and focus the objective's app window"""
+    # Check screen stability before action
+    from verification import verify_screen_stable
+    if not verify_screen_stable(timeout=2):
+        print("  Screen not stable, waiting...")
+        time.sleep(1)
+    
+    # Ensure correct window is focused before action
+    app_name = context.get('app_name', 'Notepad')
+    from window_ops import find_window, focus_window
+    window = find_window(app_name)
+    if window:
+        print(f"  [FOCUS] Ensuring '{app_name}' window is focused...")
+        focus_window(window)
+        time.sleep(0.5)  # Give time for focus to take effect
+    else:
+        print(f"  [WARN] Window '{app_name}' not found - proceeding anyway")
+
+
+def execute_action_with_retry(action, max_retries=3, context=None, step=None):
     """
     Execute action with retry logic, screen stability, and error handling
     
@@ -259,6 +334,7 @@ def execute_action_with_retry(action, max_retries=3, context=None):
         action: Action to execute
         max_retries: Maximum number of retry attempts
         context: Context object for prerequisites
+        step: Optional pre-compiled step for the action (see actions.compile_actions)
     
     Returns:
         bool: True if action completed successfully, False otherwise
@@ -266,32 +342,25 @@ def execute_action_with_retry(action, max_retries=3, context=None):
     if context is None:
         context = {}
     
+    # Compile the action once rather than on every attempt
+    if step is None:
+        try:
+            step = compile_action(action)
+        except ValueError as e:
+            print(f"  [FAIL] {e}")
+            return False
+    
     for attempt in range(max_retries):
         print(f"  Attempt {attempt + 1}/{max_retries}")
         
-        # Check screen stability before action
-        from verification import verify_screen_stable
-        if not verify_screen_stable(timeout=2):
-            print("  Screen not stable, waiting...")
-            time.sleep(1)
-        
-        # Ensure correct window is focused before action
-        app_name = context.get('app_name', 'Notepad')
-        from window_ops import find_window, focus_window
-        window = find_window(app_name)
-        if window:
-            print(f"  [FOCUS] Ensuring '{app_name}' window is focused...")
-            focus_window(window)
-            time.sleep(0.5)  # Give time for focus to take effect
-        else:
-            print(f"  [WARN] Window '{app_name}' not found - proceeding anyway")
+        _prepare_for_action(context)
         
         # Take screenshot before action for change detection
         from ui_detection import take_screenshot
         before_screenshot = take_screenshot("screenshots/before_action.png")
         
         # Execute the action
-        action_success = execute_action(action)
+        action_success = step()
         
         if action_success:
             # Take screenshot after action
@@ -411,7 +480,7 @@ def rollback_actions(history):
         elif action_type == 'hotkey':
             # Try undo
             pyautogui.hotkey('ctrl', 'z')
-        elif action_type == 'click_image' or action_type == 'click_text':
+        elif action_type in CLICK_ACTION_TYPES:
             # For click actions, try to click back or use escape
             pyautogui.press('escape')
         elif action_type == 'close_window':
@@ -3,13 +3,14 @@ Workflow Manager Module
 Handles overall workflow management and coordination
 """
 
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from config import get_app_config
 from .workflow_executor import execute_workflow_sequence
 from objectives import parse_json_objectives, filter_supported_objectives, notify_unsupported_objectives
 from app_preparation import launch_application, maximize_application, verify_application_ready
-from window_ops import find_window, focus_window
+from window_ops import find_window, focus_window, INPUT_LOCK
 from notifications import notify_error
-from utils import print_banner
+from utils import print_banner, new_session_id
 
 
 class WorkflowManager:
@@ -17,15 +18,17 @@ class WorkflowManager:
     Manages the complete workflow process
     """
     
-    def __init__(self, config):
+    def __init__(self, config, process_snapshot=None):
         """
         Initialize workflow manager with configuration
         
         Args:
             config: Configuration object
+            process_snapshot: Optional ProcessSnapshot shared by app launch checks
         """
         self.config = config
-        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.process_snapshot = process_snapshot
+        self.session_id = new_session_id()
     
     def prepare_application(self, app_name, app_config, max_retries=3):
         """
@@ -42,29 +45,74 @@ class WorkflowManager:
         print(f"Preparing {app_name} for automation...")
         
         # Step 1: Launch application
-        if not launch_application(app_name, app_config, max_retries):
+        if not launch_application(app_name, app_config, max_retries, snapshot=self.process_snapshot):
             print(f"[FAIL] Failed to launch {app_name}")
             return False
         
-        # Step 2: Maximize application
-        if not maximize_application(app_name, max_retries):
-            print(f"[FAIL] Failed to maximize {app_name}")
-            return False
-        
-        # Step 3: Verify application is ready
-        if not verify_application_ready(app_name):
-            print(f"[FAIL] {app_name} is not ready")
-            return False
+        # Look the window up once and hand the same handle to both steps
+        window = find_window(app_name)
+        
+        # Steps 2-3 move windows around, so only one app at a time
+        with INPUT_LOCK:
+            # Step 2: Maximize application
+            if not maximize_application(app_name, max_retries, window=window):
+                print(f"[FAIL] Failed to maximize {app_name}")
+                return False
+            
+            # Step 3: Verify application is ready
+            if not verify_application_ready(app_name, window=window):
+                print(f"[FAIL] {app_name} is not ready")
+                return False
         
         print(f"[OK] {app_name} prepared successfully")
         return True
     
-    def get_objectives_ready(self, objective_ids=None):
+    def prepare_applications(self, apps, max_retries=3):
+        """
+        Prepare several applications at once
+        
+        Launching and waiting for windows overlaps between apps; maximizing and
+        verifying is serialized on the input lock.
+        
+        Args:
+            apps: List of (app_name, app_config) tuples
+            max_retries: Maximum number of retry attempts per app
+        
+        Returns:
+            bool: True if every application is ready, False otherwise
+        """
+        if len(apps) == 1:
+            return self.prepare_application(apps[0][0], apps[0][1], max_retries)
+        
+        with ThreadPoolExecutor(max_workers=min(4, len(apps))) as pool:
+            futures = [pool.submit(self.prepare_application, name, app_config, max_retries)
+                       for name, app_config in apps]
+            results = [future.result() for future in futures]
+        return all(results)
+    
+    def _apps_for_objectives(self, app_name, app_config, objectives):
+        """List (app_name, app_config) for the given app plus any other app the objectives use"""
+        apps = [(app_name, app_config)]
+        seen = {app_name}
+        for objective in objectives:
+            other = objective.get('app')
+            if not other or other in seen:
+                continue
+            seen.add(other)
+            try:
+                apps.append((other, get_app_config(self.config, other)))
+            except ValueError as e:
+                print(f"[WARN] {e} - objective '{objective.get('id')}' may fail")
+        return apps
+    
+    def get_objectives_ready(self, objective_ids=None, notify=True):
         """
         Get objectives ready for execution
         
         Args:
             objective_ids: Optional list of specific objective IDs
+            notify: Notify about unsupported objectives (callers that pass False
+                send the notification themselves, see notify_unsupported_objectives)
         
         Returns:
             tuple: (supported_objectives, unsupported_objectives)
@@ -81,7 +129,7 @@ class WorkflowManager:
         supported, unsupported = filter_supported_objectives(all_objectives, objective_ids)
         
         # Step 3: Notify about unsupported objectives
-        if unsupported:
+        if notify and unsupported:
             notify_unsupported_objectives(unsupported)
         
         return supported, unsupported
@@ -100,13 +148,19 @@ class WorkflowManager:
         """
         print("Starting complete workflow process...")
         
-        # Step 1: Prepare application
-        if not self.prepare_application(app_name, app_config):
+        # Step 1: Look up the objectives to learn which apps they target
+        supported, unsupported = self.get_objectives_ready(objective_ids, notify=False)
+        
+        # Step 2: Prepare the application and any other app the objectives target
+        apps = self._apps_for_objectives(app_name, app_config, supported)
+        if not self.prepare_applications(apps):
             print("[FAIL] Application preparation failed")
             return False
         
-        # Step 2: Get objectives ready
-        supported, unsupported = self.get_objectives_ready(objective_ids)
+        # Unsupported objectives are reported once the apps are ready, as in
+        # execute_single_objective
+        if unsupported:
+            notify_unsupported_objectives(unsupported)
         
         # Step 3: Check if there are supported objectives
         if not supported: